@@ -24,7 +24,7 @@ import time
 from pydantic import BaseModel, Field
 
 from bartleby.benchmark.refs import ModelRef
-from bartleby.benchmark.sources import DEFAULT_EXTRACTION, load_source
+from bartleby.benchmark.sources import DEFAULT_EXTRACTION, SourceText, load_source
 from bartleby.benchmark.stores import (
     BenchmarkRoot,
     append_record,
@@ -111,6 +111,9 @@ def _collect_work(root: BenchmarkRoot, judge: ModelRef, passes: int) -> list[dic
     """One work item per distinct summary still short of ``passes`` OK
     judgments. Failed judgment records don't count — they're retried."""
     work: list[dict] = []
+    # Every model's results file for a doc scores against the same source;
+    # read, hash, and token-count it once, not once per model.
+    sources: dict[tuple[str, str], SourceText | None] = {}
     for path in sorted(root.results_dir.glob("*.jsonl")):
         ok_runs = [r for r in read_records(path) if r.get("ok")]
         if not ok_runs:
@@ -120,7 +123,10 @@ def _collect_work(root: BenchmarkRoot, judge: ModelRef, passes: int) -> list[dic
         doc_id = first["doc"]
         extraction = first.get("extraction", DEFAULT_EXTRACTION)
 
-        source = load_source(root, doc_id, extraction)
+        key = (doc_id, extraction)
+        if key not in sources:
+            sources[key] = load_source(root, doc_id, extraction)
+        source = sources[key]
         if source is None:
             src_path = root.source_path(doc_id, extraction)
             raise SystemExit(
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import sys
 import time
+from dataclasses import dataclass, field
 
 from rich.console import Console, Group
 from rich.live import Live
@@ -26,10 +27,23 @@ from rich.text import Text
 from bartleby.benchmark.sources import count_tokens
 
 
+@dataclass(slots=True)
+class _ActiveCall:
+    """The in-flight call's label, clock, and streamed-token bookkeeping."""
+    model: str
+    doc: str
+    run: int
+    start: float
+    deltas: list[str] = field(default_factory=list)
+    drained: int = 0
+    tail: str = ""
+    settled_toks: int = 0
+
+
 class BenchmarkProgress:
     """The object is its own renderable (``__rich__``); Live re-reads its
-    mutable state on each refresh tick, so per-chunk callbacks only stash the
-    latest text and the token estimate is computed at render time, not on
+    mutable state on each refresh tick, so per-chunk callbacks only append the
+    new delta and the token estimate is computed at render time, not on
     every one of the hundreds of stream chunks."""
 
     def __init__(self, models: list[str], calls_per_model: int, total_calls: int):
@@ -42,7 +56,13 @@ class BenchmarkProgress:
         self.total = total_calls
         self.state = {m: {"n": 0, "tps": None, "passed": None, "running": False}
                       for m in models}
-        self.active: dict | None = None
+        self.active: _ActiveCall | None = None
+        # The dashboard table only changes when a call starts or finishes, but
+        # Live asks for it on every tick. Rebuild it only when ``_version`` has
+        # moved past the one the cached table was built at; bumped *after* each
+        # state change, so a tick that races one just rebuilds on the next.
+        self._version = 0
+        self._table_cache: tuple[int, Table] | None = None
 
         self._overall = Progress(
             TextColumn("[bold]Summarizing"),
@@ -64,27 +84,58 @@ class BenchmarkProgress:
     # -- rich integration --
     def __rich__(self):
         parts = [self._overall]
-        if self.active is not None:
-            parts += [self._active_line(), self._pulse]
+        # Read ``active`` once per frame: the work thread may clear or swap it
+        # mid-render, and every piece of this frame must describe one call.
+        active = self.active
+        if active is not None:
+            parts += [self._active_line(active), self._pulse]
         parts.append(self._table())
         return Group(*parts)
 
-    def _active_line(self) -> Text:
+    def _table(self) -> Table:
+        version = self._version
+        cached = self._table_cache
+        if cached is None or cached[0] != version:
+            cached = self._table_cache = (version, self._build_table())
+        return cached[1]
+
+    def _active_line(self, a: _ActiveCall) -> Text:
         # Live estimate: tiktoken on the streamed text so far / wall time. This
         # is intentionally distinct from the table's Tok/s (Ollama's exact
         # eval_count / eval_duration, known only at completion) — this one shows
         # "tokens accruing now", that one shows measured throughput.
-        a = self.active
-        elapsed = time.perf_counter() - a["start"]
-        toks = count_tokens(a["content"])
+        elapsed = time.perf_counter() - a.start
+        toks = self._streamed_tokens(a)
         tps = toks / elapsed if elapsed > 0 else 0
         return Text.assemble(
             ("▶ ", "cyan"),
-            (f"{a['model']} · {a['doc']} (run {a['run']})", "bold"),
+            (f"{a.model} · {a.doc} (run {a.run})", "bold"),
             (f"   ~{toks} tok · {tps:.0f} tok/s · {elapsed:.1f}s", "dim"),
         )
 
-    def _table(self) -> Table:
+    def _streamed_tokens(self, a: _ActiveCall) -> int:
+        """Token count of call ``a``'s streamed text so far, incremental.
+
+        The stream only ever appends, so the text up to the last space is
+        *settled*: cl100k attaches a leading space to the following word, so a
+        split just before a space tokenizes the same as the whole. Each tick
+        drains the deltas that arrived since the last one into the unsettled
+        tail and encodes only that tail, not the full response again —
+        re-encoding it all made a long generation quadratic. Only this (render)
+        side touches the tail; ``on_chunk`` just appends to ``deltas``.
+        """
+        deltas = a.deltas
+        n = len(deltas)
+        tail = a.tail + "".join(deltas[a.drained:n])
+        a.drained = n
+        cut = tail.rfind(" ")
+        if cut > 0:
+            a.settled_toks += count_tokens(tail[:cut])
+            tail = tail[cut:]
+        a.tail = tail
+        return a.settled_toks + count_tokens(tail)
+
+    def _build_table(self) -> Table:
         t = Table(box=None, pad_edge=False, expand=False)
         t.add_column("Model")
         t.add_column("Status")
@@ -122,16 +173,16 @@ class BenchmarkProgress:
             self._live.stop()
 
     def start_call(self, model: str, doc: str, run_idx: int, call_no: int) -> None:
-        self.active = {"model": model, "doc": doc, "run": run_idx, "content": "",
-                       "start": time.perf_counter()}
+        self.active = _ActiveCall(model, doc, run_idx, time.perf_counter())
         self.state[model]["running"] = True
+        self._version += 1
         if not self.tty:
             print(f"  [{call_no}/{self.total}] {model} · {doc} (run {run_idx})",
                   file=sys.stderr, flush=True)
 
-    def on_chunk(self, content: str) -> None:
+    def on_chunk(self, delta: str) -> None:
         if self.active is not None:
-            self.active["content"] = content  # render reads this on its own tick
+            self.active.deltas.append(delta)  # render drains on its own tick
 
     def finish_call(self, model: str, ok: bool, tps: float | None) -> None:
         st = self.state[model]
@@ -140,6 +191,7 @@ class BenchmarkProgress:
         st["passed"] = ok if st["passed"] is None else (st["passed"] and ok)
         if ok and tps:
             st["tps"] = tps
+        self._version += 1
         self.active = None
         if self.tty:
             self._overall.advance(self._task)
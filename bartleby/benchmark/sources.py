@@ -26,9 +26,12 @@ import yaml
 
 from bartleby.benchmark.stores import DEFAULT_EXTRACTION, BenchmarkRoot
 
-# Production parity: the same truncation limit ingest actually uses, imported
-# (not copied) so the benchmark can't silently diverge from it.
+# Production parity: the same truncation limit and the same cl100k encoder
+# ingest actually uses, imported (not copied) so the benchmark can't silently
+# diverge from it — and a process never loads two copies of the encoder.
 from bartleby.lib.consts import DEFAULT_MAX_SUMMARIZE_TOKENS
+from bartleby.lib.tokens import count_tokens as _count_tokens
+from bartleby.lib.tokens import truncate_to_tokens as _truncate_to_tokens
 
 DOC_ID_RE = re.compile(r"^[a-z0-9-]+$")
 
@@ -64,28 +67,13 @@ def select_documents(corpus: dict[str, Path], documents: list[str] | None) -> di
     return {d: corpus[d] for d in documents}
 
 
-_ENCODING = None
-
-
-def _cl100k():
-    """Lazy, process-wide cl100k_base encoder."""
-    global _ENCODING
-    if _ENCODING is None:
-        import tiktoken
-        _ENCODING = tiktoken.get_encoding("cl100k_base")
-    return _ENCODING
-
-
 def count_tokens(text: str) -> int:
-    return len(_cl100k().encode(text)) if text else 0
+    return _count_tokens(text) if text else 0
 
 
 def truncate_to_tokens(text: str, max_tokens: int) -> tuple[str, bool]:
-    tok = _cl100k()
-    ids = tok.encode(text)
-    if len(ids) <= max_tokens:
-        return text, False
-    return tok.decode(ids[:max_tokens]), True
+    truncated, total = _truncate_to_tokens(text, max_tokens)
+    return truncated, total > max_tokens
 
 
 def build_summary_input(pdf_path: Path) -> tuple[str, dict]:
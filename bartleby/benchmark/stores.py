@@ -134,11 +134,16 @@ def make_openai_client(root: BenchmarkRoot):
 
 
 def append_record(path: Path, record: dict) -> None:
-    """Append one timestamped JSON line; creates the store on first write."""
+    """Append one timestamped JSON line; creates the store on first write.
+
+    Opened per record on purpose: a record lands once per multi-second model
+    call, and closing after each line keeps every finished call on disk if a
+    long matrix run is killed. The line itself is compact JSON.
+    """
     record = {"timestamp": time.time(), **record}
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("a") as f:
-        f.write(json.dumps(record) + "\n")
+        f.write(json.dumps(record, separators=(",", ":")) + "\n")
 
 
 def read_records(path: Path) -> list[dict]:
@@ -77,29 +77,32 @@ def call_ollama(client, model: str, document_text: str, temperature: float,
                 on_chunk=None) -> dict:
     """One streaming Ollama summarize call.
 
-    Streams so ``on_chunk(content_so_far)`` can drive the live view; the final
-    chunk carries the timing metadata. Accumulated content is validated against
-    ``DocumentSummary`` at the end.
+    Streams so ``on_chunk(delta)`` can drive the live view; the final chunk
+    carries the timing metadata. Deltas are collected and joined once, then
+    validated against ``DocumentSummary`` at the end — growing one string per
+    chunk while the view also held it re-copied the whole response every time.
     """
     from pydantic import ValidationError
 
-    from bartleby.providers.base import DocumentSummary
+    from bartleby.providers.base import DocumentSummary, json_schema
     from bartleby.providers.prompt import build_summary_messages
 
     wall_start = time.perf_counter()
-    content = ""
+    parts: list[str] = []
     final = None
     try:
         for chunk in client.chat(
             model=model,
             messages=build_summary_messages(document_text),
-            format=DocumentSummary.model_json_schema(),
+            format=json_schema(DocumentSummary),
             options={"temperature": temperature},
             stream=True,
         ):
-            content += chunk.message.content or ""
-            if on_chunk is not None:
-                on_chunk(content)
+            delta = chunk.message.content
+            if delta:
+                parts.append(delta)
+                if on_chunk is not None:
+                    on_chunk(delta)
             if getattr(chunk, "done", False):
                 final = chunk
     except Exception as e:
@@ -109,9 +112,10 @@ def call_ollama(client, model: str, document_text: str, temperature: float,
             "error": f"{type(e).__name__}: {e}",
             # Whatever streamed before the failure — a timeout at 90% still
             # leaves forensics.
-            "raw_output": content,
+            "raw_output": "".join(parts),
         }
     wall_seconds = time.perf_counter() - wall_start
+    content = "".join(parts)
 
     timings = _extract_timings(final) if final is not None else {}
     try:
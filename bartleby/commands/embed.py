@@ -20,5 +20,6 @@ def main(text: str) -> None:
         sys.exit(1)
 
     [vector] = embed_texts([text])
-    json.dump(vector, sys.stdout, separators=(",", ":"))
+    # dumps (C encoder), not dump (pure-Python streaming encoder).
+    sys.stdout.write(json.dumps(vector, separators=(",", ":")))
     sys.stdout.write("\n")
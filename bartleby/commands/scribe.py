@@ -29,6 +29,7 @@ from __future__ import annotations
 import json
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from loguru import logger
@@ -41,6 +42,7 @@ from bartleby.config import (
 from bartleby.db.connection import open_db, resolve_project_name
 from bartleby.ingest import caption
 from bartleby.ingest import classify
+from bartleby.ingest import embed
 from bartleby.ingest import parse
 from bartleby.ingest import parsers
 from bartleby.ingest import resolve
@@ -305,15 +307,30 @@ def main(
             # Drains the pool through the single Writer and returns the DocUnits
             # (resumed + freshly parsed) the next two phases carry forward.
             incomplete_count = 0
-            units = parse.parse_all(
-                writer, to_parse, to_resume,
-                parse_config=parse_config,
-                max_workers=max_workers,
-                progress=progress,
-                required_models=required_models,
-                verbose=verbose,
-                timings=timings,
-            )
+            # A pooled parse embeds in its workers, so this process has yet to
+            # load the embedding model that summarize persists with. Load it on
+            # a side thread while the workers parse, not on the first persist
+            # afterwards. A failed load is left for that persist to raise. Only
+            # for summaries: whether there are images to caption isn't known
+            # until parse ends. Parse never waits on the load — the first
+            # embed_texts does, through the model lock, if it's still running.
+            warm = None
+            if max_workers > 1 and summaries_enabled:
+                warm = ThreadPoolExecutor(max_workers=1)
+                warm.submit(embed.prewarm)
+            try:
+                units = parse.parse_all(
+                    writer, to_parse, to_resume,
+                    parse_config=parse_config,
+                    max_workers=max_workers,
+                    progress=progress,
+                    required_models=required_models,
+                    verbose=verbose,
+                    timings=timings,
+                )
+            finally:
+                if warm is not None:
+                    warm.shutdown(wait=False, cancel_futures=True)
 
             # ---- Phase 2: caption every uncaptioned image, concurrently ------
             # _caption_all drives the phase directly: start() reveals the caption
@@ -19,7 +19,9 @@ import apsw
 from bartleby.db.schema import ALLOWED_SOURCE_KINDS, EMBEDDING_DIM
 
 
-@dataclass
+# slots: one of these exists per chunk in flight — tens of thousands for a
+# large filing — so drop the per-instance __dict__.
+@dataclass(slots=True)
 class ChunkInput:
     text: str
     embedding: list[float]
@@ -66,32 +68,54 @@ def _insert(
         return []
     _validate(chunks)
 
-    inserted_ids: list[int] = []
+    # One executemany per table: each statement is compiled once and re-bound in
+    # C per row, instead of three Python-level execute() round trips per chunk.
+    # RETURNING yields the new ids in parameter order, which pairs them back up
+    # with their chunks for the FTS5 / sqlite-vec rows.
     with conn:
         cur = conn.cursor()
-        for c in chunks:
-            cur.execute(
+        inserted_ids = [
+            row[0]
+            for row in cur.executemany(
                 "INSERT INTO chunks "
                 "(source_kind, source_id, chunk_index, text, "
                 " section_heading, page_number, content_type, ingest_run_id) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                (source_kind, source_id, c.chunk_index, c.text,
-                 c.section_heading, c.page_number, c.content_type,
-                 ingest_run_id),
-            )
-            chunk_id = conn.last_insert_rowid()
-            inserted_ids.append(chunk_id)
-            cur.execute(
-                "INSERT INTO chunks_fts(rowid, text, section_heading) VALUES (?, ?, ?)",
-                (chunk_id, c.text, c.section_heading or ""),
-            )
-            cur.execute(
-                "INSERT INTO chunks_vec(rowid, embedding) VALUES (?, ?)",
-                (chunk_id, _pack_embedding(c.embedding)),
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) RETURNING chunk_id",
+                [
+                    (source_kind, source_id, c.chunk_index, c.text,
+                     c.section_heading, c.page_number, c.content_type,
+                     ingest_run_id)
+                    for c in chunks
+                ],
             )
+        ]
+        cur.executemany(
+            "INSERT INTO chunks_fts(rowid, text, section_heading) VALUES (?, ?, ?)",
+            [
+                (chunk_id, c.text, c.section_heading or "")
+                for chunk_id, c in zip(inserted_ids, chunks)
+            ],
+        )
+        cur.executemany(
+            "INSERT INTO chunks_vec(rowid, embedding) VALUES (?, ?)",
+            [
+                (chunk_id, _pack_embedding(c.embedding))
+                for chunk_id, c in zip(inserted_ids, chunks)
+            ],
+        )
     return inserted_ids
 
 
+def _delete_index_rows(cur: apsw.Cursor, ids: list[int]) -> None:
+    """Drop the FTS5 and sqlite-vec rows for ``ids`` — one executemany apiece.
+
+    The caller holds the transaction and deletes the ``chunks`` rows itself.
+    """
+    rowids = [(cid,) for cid in ids]
+    cur.executemany("DELETE FROM chunks_fts WHERE rowid = ?", rowids)
+    cur.executemany("DELETE FROM chunks_vec WHERE rowid = ?", rowids)
+
+
 def insert_document_chunks(
     conn: apsw.Connection,
     document_id: int,
@@ -152,9 +176,7 @@ def delete_chunks_of_kind(conn: apsw.Connection, source_kind: str) -> list[int]:
                 (source_kind,),
             )
         ]
-        for cid in ids:
-            cur.execute("DELETE FROM chunks_fts WHERE rowid = ?", (cid,))
-            cur.execute("DELETE FROM chunks_vec WHERE rowid = ?", (cid,))
+        _delete_index_rows(cur, ids)
         cur.execute("DELETE FROM chunks WHERE source_kind = ?", (source_kind,))
     return ids
 
@@ -195,9 +217,7 @@ def delete_chunks_for(
                 (source_kind, source_id),
             )
         ]
-        for cid in ids:
-            cur.execute("DELETE FROM chunks_fts WHERE rowid = ?", (cid,))
-            cur.execute("DELETE FROM chunks_vec WHERE rowid = ?", (cid,))
+        _delete_index_rows(cur, ids)
         cur.execute(
             "DELETE FROM chunks WHERE source_kind = ? AND source_id = ?",
             (source_kind, source_id),
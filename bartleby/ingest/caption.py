@@ -8,9 +8,10 @@ embedding + DB write stay on the calling thread.
 
 from __future__ import annotations
 
+import itertools
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 from bartleby.ingest import images as image_pipeline
@@ -181,16 +182,26 @@ def _caption_all(
                 phase.advance()
         return
 
+    # Pooled: a bounded producer/consumer — at most ``2 * caption_workers``
+    # analyses in flight, topped up one per completion. Each finished analysis is
+    # embedded and written here while the pool keeps OCR/VLM busy, and an
+    # archive of thousands of images never holds every JPEG + result at once.
+    it = iter(to_caption.items())
     with ThreadPoolExecutor(max_workers=caption_workers) as pool:
-        futures = {
+        in_flight = {
             pool.submit(_analyze, image_id, pi): image_id
-            for image_id, pi in to_caption.items()
+            for image_id, pi in itertools.islice(it, 2 * caption_workers)
         }
-        for fut in as_completed(futures):
-            image_id = futures[fut]
-            try:
-                _persist(image_id, fut.result())
-            except Exception as e:
-                _fail(image_id, e)
-            if phase is not None:
-                phase.advance()
+        while in_flight:
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                image_id = in_flight.pop(fut)
+                try:
+                    _persist(image_id, fut.result())
+                except Exception as e:
+                    _fail(image_id, e)
+                if phase is not None:
+                    phase.advance()
+                nxt = next(it, None)
+                if nxt is not None:
+                    in_flight[pool.submit(_analyze, *nxt)] = nxt[0]
@@ -96,7 +96,7 @@ def resolve_format_filter(names: list[str]) -> set[str]:
 _MD_CHUNK_CHARS = 1600
 
 
-@dataclass
+@dataclass(slots=True)  # one per chunk, like ChunkInput
 class ChunkRow:
     text: str
     section_heading: str | None
@@ -136,6 +136,7 @@ def convert_and_chunk(path: Path) -> ConversionResult:
 
 
 _HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*$")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
 
 
 def chunk_markdown_string(markdown: str) -> list[ChunkRow]:
@@ -173,7 +174,7 @@ def _split_by_size(text: str, max_chars: int) -> list[str]:
         return [text]
     out: list[str] = []
     buf = ""
-    for para in re.split(r"\n\s*\n", text):
+    for para in _PARAGRAPH_BREAK_RE.split(text):
         if not para.strip():
             continue
         if len(para) > max_chars:
@@ -21,11 +21,10 @@ from bartleby.lib import console
 
 
 def _hash_file(path: Path) -> str:
-    h = hashlib.sha256()
+    # file_digest drives the read loop in C (and straight off the fd for a real
+    # file), instead of a Python-level read/update per 64 KiB block.
     with path.open("rb") as f:
-        for block in iter(lambda: f.read(64 * 1024), b""):
-            h.update(block)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 def _collect_files(
     paths: list[Path], only: set[str] | None = None,
@@ -3,11 +3,18 @@
 One SentenceTransformer instance per process. Loading is lazy because the
 first ``encode`` call costs ~5–10s and we don't want to pay it just because
 someone ran ``bartleby --help``.
+
+Vectors are memoized per process by the SHA-256 of the text, so a body that
+recurs — a page footer, a boilerplate disclaimer, an exhibit repeated across
+filings — is encoded once per worker rather than once per appearance.
 """
 
 from __future__ import annotations
 
+import hashlib
 import os
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 
 import numpy as np
@@ -18,9 +25,26 @@ from bartleby.lib.consts import EMBEDDING_MODEL
 # SentenceTransformer's tokenizer worker pool fights with our own loops on macOS.
 os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
 
+# Per-process LRU of text digest → float32 vector. At 768 dims a row is 3 KB, so
+# the cap holds the cache to ~25 MB — small next to the model itself. The model
+# is fixed per process (EMBEDDING_MODEL), so the digest alone is the key.
+EMBED_CACHE_SIZE = 8192
+_CACHE: OrderedDict[str, np.ndarray] = OrderedDict()
+
+
+_MODEL_LOCK = threading.Lock()
+
 
-@lru_cache(maxsize=1)
 def _model():
+    # lru_cache alone doesn't block a second caller mid-load — it would load a
+    # second copy. scribe warms the model on a side thread, so a persist that
+    # arrives first waits here for that load instead.
+    with _MODEL_LOCK:
+        return _load_model()
+
+
+@lru_cache(maxsize=1)
+def _load_model():
     from sentence_transformers import SentenceTransformer
 
     return SentenceTransformer(EMBEDDING_MODEL)
@@ -39,19 +63,44 @@ def embed_texts(texts: list[str]) -> list[list[float]]:
     """Return a list of 768-dim float lists, one per input text.
 
     Embeddings are L2-normalized to keep cosine and dot products equivalent.
+    Only texts missing from the per-process cache (deduplicated within the
+    call) reach the model; hits are served from memory.
     """
     if not texts:
         return []
-    model = _model()
-    arr = model.encode(
-        texts,
-        normalize_embeddings=True,
-        convert_to_numpy=True,
-        show_progress_bar=False,
-    ).astype(np.float32, copy=False)
-    if arr.shape[1] != EMBEDDING_DIM:
-        raise RuntimeError(
-            f"Embedding model produced {arr.shape[1]} dims; "
-            f"schema requires {EMBEDDING_DIM}."
-        )
-    return [row.tolist() for row in arr]
+    keys = [hashlib.sha256(t.encode("utf-8")).hexdigest() for t in texts]
+    resolved: dict[str, np.ndarray] = {}
+    misses: dict[str, str] = {}
+    for key, text in zip(keys, texts):
+        if key in resolved or key in misses:
+            continue
+        hit = _CACHE.get(key)
+        if hit is not None:
+            _CACHE.move_to_end(key)
+            resolved[key] = hit
+        else:
+            misses[key] = text
+
+    if misses:
+        model = _model()
+        arr = model.encode(
+            list(misses.values()),
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        ).astype(np.float32, copy=False)
+        if arr.shape[1] != EMBEDDING_DIM:
+            raise RuntimeError(
+                f"Embedding model produced {arr.shape[1]} dims; "
+                f"schema requires {EMBEDDING_DIM}."
+            )
+        for key, row in zip(misses, arr):
+            # Copy out of the batch: a cached view would pin the whole batch
+            # array for as long as the entry stays hot.
+            row = row.copy()
+            resolved[key] = row
+            _CACHE[key] = row
+        while len(_CACHE) > EMBED_CACHE_SIZE:
+            _CACHE.popitem(last=False)
+
+    return [resolved[key].tolist() for key in keys]
@@ -30,10 +30,10 @@ from bartleby.ingest.chunk import (
     ChunkRow,
     convert_and_chunk,
 )
-from bartleby.ingest.summarize import count_tokens
 from bartleby.ingest.text import chunk_text
 from bartleby.ingest.writer import ParsedDocument, ParsedImage, ParsedSection
 from bartleby.lib import timing
+from bartleby.lib.tokens import count_tokens
 
 
 HTML_EXTENSIONS = {".html", ".htm"}
@@ -227,10 +227,25 @@ def _parse_html_sec2md_split(
     is one atomic write unit — the Writer persists the container last."""
     if on_stage is not None:
         on_stage("embedding")
+    # Gather every section's rows first and embed the whole filing in one
+    # encode call, then slice the vectors back out per section — one batch
+    # instead of N small ones (a 10-K splits into dozens of sections).
+    section_rows = [
+        [_sec2md_chunk_to_row(c, fallback_heading=sec.title)
+         for c in sec.result.chunks]
+        for sec in sections
+    ]
+    flat_rows = [row for rows in section_rows for row in rows]
+    embeddings = (
+        embed.embed_texts([r.text for r in flat_rows]) if flat_rows else []
+    )
+
     parsed_sections: list[ParsedSection] = []
     total_tokens = 0
-    for sec in sections:
-        chunks = _build_sec2md_chunks(sec.result, fallback_heading=sec.title)
+    offset = 0
+    for sec, rows in zip(sections, section_rows):
+        chunks = _build_chunk_inputs(rows, embeddings[offset:offset + len(rows)])
+        offset += len(rows)
         token_count = _token_count(sec.result.full_text)
         total_tokens += token_count
         parsed_sections.append(ParsedSection(
@@ -28,6 +28,7 @@ are unsafe to inherit across a fork on macOS.
 from __future__ import annotations
 
 import multiprocessing
+import os
 import threading
 from dataclasses import dataclass
 from typing import Callable, Iterable, Iterator, TypeVar
@@ -60,7 +61,9 @@ _CONFIG: object = None
 _PROGRESS_Q: object = None
 
 
-def _init_worker(parse_fn, config, warmup, verbose, required_models, progress_q) -> None:
+def _init_worker(
+    parse_fn, config, warmup, verbose, required_models, progress_q, cpu_share,
+) -> None:
     """Set up one spawned worker: stash the parse fn + config, quieten, warm.
 
     A spawned worker is a fresh interpreter. Environment set in the parent is
@@ -75,6 +78,15 @@ def _init_worker(parse_fn, config, warmup, verbose, required_models, progress_q)
 
     import sys
 
+    # The pool's parallelism is across documents. Left alone, every worker's
+    # OpenMP runtimes — torch's intra-op pool (the embedding model, docling's
+    # layout models) and each Tesseract subprocess, which inherits this — fan
+    # out across all cores, so N workers oversubscribe the box N-fold. Give each
+    # worker its share instead. Set before torch is first imported, which is
+    # when it reads this; an explicit value wins. Not OMP_THREAD_LIMIT: that
+    # caps every OpenMP team in the process, torch's included, at the value.
+    os.environ.setdefault("OMP_NUM_THREADS", str(cpu_share))
+
     from loguru import logger
 
     from bartleby.lib.quiet import setup_quiet_third_party
@@ -170,6 +182,7 @@ def parse_stream(
         return
 
     ctx = multiprocessing.get_context("spawn")
+    cpu_share = max(1, (os.cpu_count() or 1) // max_workers)
     # A Manager queue (proxy-based) pickles cleanly into spawn workers via the
     # initializer, where a bare ctx.Queue() does not. Progress is low-volume, so
     # the proxy overhead is noise. None when the caller wants no progress.
@@ -192,6 +205,7 @@ def parse_stream(
             initializer=_init_worker,
             initargs=(
                 parse_fn, config, warmup, verbose, tuple(required_models), progress_q,
+                cpu_share,
             ),
         ) as pool:
             # chunksize=1 (imap_unordered default): a worker pulls the next single
@@ -105,6 +105,10 @@ class ScribeProgress:
         self._samples: deque[tuple[float, int]] = deque(maxlen=_ETA_SAMPLES)
         self._active_eta: float | None = None
 
+        # The header only changes when a phase starts or advances, but Live asks
+        # for it on every refresh; keep the last one until a tally moves.
+        self._header_text: Text | None = None
+
         shared = console.get_console()
 
         # Cap lanes so the live region (header + overall bar + one row per lane)
@@ -139,7 +143,9 @@ class ScribeProgress:
             self._lanes.add_task("lane", label="", visible=False)
             for _ in range(n_lanes)
         ]
-        self._free: list[int] = list(range(len(self._lane_tasks)))
+        # FIFO of idle lane indices: lanes are handed out top-down, and popleft
+        # keeps that O(1) where list.pop(0) shifts the rest of the list.
+        self._free: deque[int] = deque(range(len(self._lane_tasks)))
         # Insertion-ordered so the oldest-active key can be evicted (LRU) when a
         # new worker needs a lane and none are free — see _lane_update.
         self._by_key: "OrderedDict[object, int]" = OrderedDict()
@@ -157,8 +163,18 @@ class ScribeProgress:
         return Group(self._header(), self._overall, self._lanes)
 
     def _header(self) -> Text:
-        segments: list[Text] = []
-        for phase in PHASES:
+        # Built under the lock so a tally that moves mid-build can't leave a
+        # stale header cached past its invalidation.
+        with self._lock:
+            if self._header_text is None:
+                self._header_text = self._build_header()
+            return self._header_text
+
+    def _build_header(self) -> Text:
+        # One Text, appended in place: no per-phase Text plus a join that
+        # copies every span again.
+        header = Text("Run of show  ", style="bold")
+        for i, phase in enumerate(PHASES):
             tally = (
                 f"{self._done[phase]}/{self._total[phase]}"
                 if self._known[phase] else "—"
@@ -168,15 +184,16 @@ class ScribeProgress:
             # a finished phase has cleared it, a pending one never had one.
             if phase == self._active and self._active_eta is not None:
                 label += f" · ~{_fmt_eta(self._active_eta)} left"
-            seg = Text(label)
             if phase == self._active:
-                seg.stylize("bold cyan")
+                style = "bold cyan"
             elif self._known[phase] and self._done[phase] >= self._total[phase]:
-                seg.stylize("dim green")          # finished
+                style = "dim green"               # finished
             else:
-                seg.stylize("dim")                # pending / unknown
-            segments.append(seg)
-        return Text("Run of show  ", style="bold") + Text(" · ").join(segments)
+                style = "dim"                     # pending / unknown
+            if i:
+                header.append(" · ")
+            header.append(label, style=style)
+        return header
 
     def _refresh_overall(self) -> None:
         # Total counts only phases whose denominator is known yet — so the bar
@@ -202,7 +219,7 @@ class ScribeProgress:
         with self._lock:
             for task in self._lane_tasks:
                 self._lanes.update(task, label="", visible=False)
-            self._free = list(range(len(self._lane_tasks)))
+            self._free = deque(range(len(self._lane_tasks)))
             self._by_key.clear()
 
     def _lane_update(self, key: object, item: str, stage: str) -> None:
@@ -216,7 +233,7 @@ class ScribeProgress:
                     # stopped reporting — and reuse its lane for this live one.
                     _, idx = self._by_key.popitem(last=False)
                 else:
-                    idx = self._free.pop(0)
+                    idx = self._free.popleft()
                 self._by_key[key] = idx
             else:
                 self._by_key.move_to_end(key)   # mark recently-active for LRU
@@ -258,6 +275,7 @@ class ScribeProgress:
             self._known[name] = True
             self._samples.clear()         # a phase's rate is its own, not the last's
             self._recompute_eta(name)
+            self._header_text = None
         self._clear_lanes()       # new phase, fresh lanes
         self._refresh_overall()
 
@@ -265,6 +283,7 @@ class ScribeProgress:
         with self._lock:
             self._done[name] += n
             self._recompute_eta(name)
+            self._header_text = None
         self._refresh_overall()
 
 
@@ -11,8 +11,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from datetime import date
-from functools import lru_cache
-
+from bartleby.lib.tokens import truncate_to_tokens
 from bartleby.providers import DocumentSummary, Provider
 
 
@@ -86,26 +85,6 @@ class SummaryResult:
     authored_date: str | None  # ISO 8601, NULL when not stated or malformed
 
 
-@lru_cache(maxsize=1)
-def _tokenizer():
-    import tiktoken
-
-    return tiktoken.get_encoding("cl100k_base")
-
-
-def count_tokens(text: str) -> int:
-    return len(_tokenizer().encode(text))
-
-
-def _truncate_to_tokens(text: str, max_tokens: int) -> tuple[str, int]:
-    tok = _tokenizer()
-    ids = tok.encode(text)
-    if len(ids) <= max_tokens:
-        return text, len(ids)
-    truncated = tok.decode(ids[:max_tokens])
-    return truncated, len(ids)
-
-
 def _truncation_note(used: int, total: int) -> str:
     return (
         f"\n\n_Note: this summary is based on the first {used:,} tokens "
@@ -130,7 +109,7 @@ def summarize(
     if not document_text or not document_text.strip():
         raise ValueError("document_text is empty")
 
-    input_text, total_tokens = _truncate_to_tokens(document_text, max_summarize_tokens)
+    input_text, total_tokens = truncate_to_tokens(document_text, max_summarize_tokens)
     truncated = total_tokens > max_summarize_tokens
 
     summary: DocumentSummary = provider.summarize(
@@ -0,0 +1,35 @@
+"""Token counting and truncation on the ``tiktoken cl100k_base`` encoder.
+
+The one encoder ingest measures and cuts document text with: the summarizer
+truncates its input here, parsing records each document's token count, and the
+benchmark imports the same helpers so its inputs can't drift from production.
+Kept free of the provider stack so those callers import only tiktoken.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _tokenizer():
+    import tiktoken
+
+    return tiktoken.get_encoding("cl100k_base")
+
+
+# encode_ordinary, not encode: document text is data, never control tokens. It
+# skips encode's extra whole-text scan for special tokens — and a filing that
+# happens to contain a literal "<|endoftext|>" no longer raises mid-ingest.
+def count_tokens(text: str) -> int:
+    return len(_tokenizer().encode_ordinary(text))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> tuple[str, int]:
+    """``text`` cut to its first ``max_tokens`` tokens, plus its full count."""
+    tok = _tokenizer()
+    ids = tok.encode_ordinary(text)
+    if len(ids) <= max_tokens:
+        return text, len(ids)
+    truncated = tok.decode(ids[:max_tokens])
+    return truncated, len(ids)
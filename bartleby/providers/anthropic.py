@@ -8,7 +8,7 @@ from anthropic import Anthropic
 from pydantic import BaseModel, ValidationError
 
 from bartleby.lib import console
-from bartleby.providers.base import DocumentSummary, VlmDescription
+from bartleby.providers.base import DocumentSummary, VlmDescription, json_schema
 from bartleby.providers.prompt import (
     IMAGE_DESCRIPTION_INSTRUCTIONS,
     build_summary_messages,
@@ -117,7 +117,7 @@ class AnthropicProvider:
             tools=[{
                 "name": _SUMMARY_TOOL,
                 "description": "Save the document summary.",
-                "input_schema": DocumentSummary.model_json_schema(),
+                "input_schema": json_schema(DocumentSummary),
             }],
             tool_choice={"type": "tool", "name": _SUMMARY_TOOL},
         )
@@ -140,6 +140,7 @@ class AnthropicProvider:
         model: str,
         schema: type[BaseModel],
         temperature: float = 0.0,
+        instructions: str | None = None,
     ) -> BaseModel:
         kwargs: dict = dict(
             model=model,
@@ -149,10 +150,20 @@ class AnthropicProvider:
             tools=[{
                 "name": _CLASSIFY_TOOL,
                 "description": "Save the classification result.",
-                "input_schema": schema.model_json_schema(),
+                "input_schema": json_schema(schema),
             }],
             tool_choice={"type": "tool", "name": _CLASSIFY_TOOL},
         )
+        if instructions:
+            # Cache breakpoint on the sweep-constant system block: tools + system
+            # are then read from the prompt cache on every call after the first.
+            # Prefixes under the model's minimum cacheable length are simply not
+            # cached — the request is unaffected.
+            kwargs["system"] = [{
+                "type": "text",
+                "text": instructions,
+                "cache_control": {"type": "ephemeral"},
+            }]
         # Temperature-rejecting models 400 on temperature (see summarize) — drop it
         # wherever it would 400. Tag classification reuses the summarizer's model, so
         # a Fable-5/Opus-4.7+ config would otherwise 400 on every classify call.
@@ -192,7 +203,7 @@ class AnthropicProvider:
             tools=[{
                 "name": _IMAGE_TOOL,
                 "description": "Save the image description.",
-                "input_schema": VlmDescription.model_json_schema(),
+                "input_schema": json_schema(VlmDescription),
             }],
             tool_choice={"type": "tool", "name": _IMAGE_TOOL},
         )
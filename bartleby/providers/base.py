@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Literal, Protocol, TypeVar
 
 from pydantic import BaseModel, Field
@@ -9,6 +10,17 @@ from pydantic import BaseModel, Field
 _T = TypeVar("_T", bound=BaseModel)
 
 
+@lru_cache(maxsize=None)
+def json_schema(model_cls: type[BaseModel]) -> dict:
+    """``model_cls.model_json_schema()``, generated once per class.
+
+    Pydantic rebuilds the schema on every call (~0.7 ms for DocumentSummary),
+    and the providers send one with every summarize / caption / classify
+    request. Callers treat the returned dict as read-only.
+    """
+    return model_cls.model_json_schema()
+
+
 class DocumentSummary(BaseModel):
     """Schema enforced across providers via structured output.
 
@@ -128,10 +140,16 @@ class Provider(Protocol):
         model: str,
         schema: type[_T],
         temperature: float = 0.0,
+        instructions: str | None = None,
     ) -> _T:
         """Structured-output call for arbitrary Pydantic schemas.
 
         Used wherever the codebase needs typed JSON out of an LLM that
         isn't `summarize`/`analyze_image` — e.g. tag classification.
+
+        ``instructions`` carries the part of the request that stays the same
+        across a sweep (the task and, for tagging, the whole vocabulary). It is
+        sent as the system prompt, ahead of the per-call ``prompt``, so repeated
+        calls share a byte-identical prefix the provider can cache.
         """
         ...
@@ -7,7 +7,7 @@ import os
 import ollama
 from pydantic import BaseModel, ValidationError
 
-from bartleby.providers.base import DocumentSummary, VlmDescription
+from bartleby.providers.base import DocumentSummary, VlmDescription, json_schema
 from bartleby.providers.prompt import (
     IMAGE_DESCRIPTION_INSTRUCTIONS,
     build_summary_messages,
@@ -33,7 +33,7 @@ class OllamaProvider:
         response = self._client.chat(
             model=model,
             messages=build_summary_messages(document_text),
-            format=DocumentSummary.model_json_schema(),
+            format=json_schema(DocumentSummary),
             options={"temperature": temperature},
         )
         return _validate(response.message.content, DocumentSummary)
@@ -45,11 +45,17 @@ class OllamaProvider:
         model: str,
         schema: type[BaseModel],
         temperature: float = 0.0,
+        instructions: str | None = None,
     ) -> BaseModel:
+        # A constant system message lets the server reuse its KV cache for the
+        # shared prefix across a classification sweep.
+        messages = [{"role": "user", "content": prompt}]
+        if instructions:
+            messages.insert(0, {"role": "system", "content": instructions})
         response = self._client.chat(
             model=model,
-            messages=[{"role": "user", "content": prompt}],
-            format=schema.model_json_schema(),
+            messages=messages,
+            format=json_schema(schema),
             options={"temperature": temperature},
         )
         return _validate(response.message.content, schema)
@@ -70,7 +76,7 @@ class OllamaProvider:
                 "content": IMAGE_DESCRIPTION_INSTRUCTIONS,
                 "images": [image_bytes],
             }],
-            format=VlmDescription.model_json_schema(),
+            format=json_schema(VlmDescription),
             options={"temperature": temperature},
         )
         return _validate(response.message.content, VlmDescription)
@@ -64,11 +64,14 @@ class OpenAIProvider:
         model: str,
         schema: type[BaseModel],
         temperature: float = 0.0,
+        instructions: str | None = None,
     ) -> BaseModel:
         _drop_temperature(temperature)
+        # A leading system message keeps the sweep-constant part of the request
+        # an identical prefix, which OpenAI's automatic prompt caching reuses.
         response = self._client.chat.completions.parse(
             model=model,
-            messages=[{"role": "user", "content": prompt}],
+            messages=_with_system(instructions, prompt),
             response_format=schema,
         )
         return _require_parsed(response, schema)
@@ -100,6 +103,13 @@ class OpenAIProvider:
         return _require_parsed(response, VlmDescription)
 
 
+def _with_system(instructions: str | None, prompt: str) -> list[dict]:
+    messages = [{"role": "user", "content": prompt}]
+    if instructions:
+        messages.insert(0, {"role": "system", "content": instructions})
+    return messages
+
+
 def _require_parsed(response, model_cls):
     parsed = response.choices[0].message.parsed
     if parsed is None:
@@ -24,13 +24,13 @@ SUMMARY_INSTRUCTIONS = (
 )
 
 
+# Everything ahead of the document is fixed, so it's built once here; each call
+# then appends the (possibly ~50k-token) document in a single concatenation.
+_SUMMARY_HEAD = f"{SUMMARY_INSTRUCTIONS}\n\nDOCUMENT:\n"
+
+
 def build_summary_messages(document_text: str) -> list[dict]:
-    return [
-        {
-            "role": "user",
-            "content": f"{SUMMARY_INSTRUCTIONS}\n\nDOCUMENT:\n{document_text}",
-        }
-    ]
+    return [{"role": "user", "content": _SUMMARY_HEAD + document_text}]
 
 
 IMAGE_DESCRIPTION_INSTRUCTIONS = (
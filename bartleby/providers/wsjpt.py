@@ -108,10 +108,18 @@ class WsjptProvider:
         model: str,
         schema: type[BaseModel],
         temperature: float = 0.0,
+        instructions: str | None = None,
     ) -> BaseModel:
         # temperature ignored (see summarize) — wsjpt owns model settings.
-        # The prompt is self-contained, so no custom_instructions.
-        jpt = self._Jpt(schema, model_config=self._model_config(model))
+        if instructions is None:
+            # The prompt is self-contained, so no custom_instructions.
+            jpt = self._Jpt(schema, model_config=self._model_config(model))
+        else:
+            jpt = self._Jpt(
+                schema,
+                model_config=self._model_config(model),
+                custom_instructions=instructions,
+            )
         return jpt.parse(input_text=prompt)
 
     def analyze_image(
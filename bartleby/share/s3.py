@@ -10,6 +10,7 @@ out of scope for this command.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import BinaryIO
 from urllib.parse import urlparse
 
 
@@ -48,7 +49,7 @@ def _client():
     return boto3.client("s3")
 
 
-def put_bytes(client, target: S3Target, name: str, data: bytes) -> str:
+def put_bytes(client, target: S3Target, name: str, data: bytes | BinaryIO) -> str:
     """Upload ``data`` under ``target``'s prefix as object ``name``.
 
     Returns the full ``s3://`` URL the object landed at.
@@ -59,10 +60,15 @@ def put_bytes(client, target: S3Target, name: str, data: bytes) -> str:
 
 
 def put_file(client, target: S3Target, name: str, path) -> str:
-    """Read ``path`` and upload it under ``target`` as object ``name``."""
+    """Upload the file at ``path`` under ``target`` as object ``name``.
+
+    The open file is handed to boto3 as the body, which streams it — a
+    multi-gigabyte published ``.db`` is never read into memory whole.
+    """
     from pathlib import Path
 
-    return put_bytes(client, target, name, Path(path).read_bytes())
+    with Path(path).open("rb") as f:
+        return put_bytes(client, target, name, f)
 
 
 def get_bytes(client, target: S3Target, name: str) -> bytes:
@@ -96,7 +96,10 @@ def build_arg_parser(
 
 
 def _print_json(payload: Any) -> None:
-    json.dump(payload, sys.stdout, separators=(",", ":"), default=str)
+    # dumps + one write, not dump: json.dump streams through the pure-Python
+    # encoder, while dumps takes the C one — about twice as fast on a search
+    # payload, for one extra string the size of the output.
+    sys.stdout.write(json.dumps(payload, separators=(",", ":"), default=str))
     sys.stdout.write("\n")
 
 
@@ -36,6 +36,8 @@ _OUTPUT_FIELD_TYPES = {
     "assigned_tag_ids": "tag",
 }
 
+_CONTAINERS = (dict, list)
+
 
 def format_id(id_type: str, value: int | None) -> str | None:
     """Render ``value`` as ``"<id_type>:<value>"`` (``None`` passes through)."""
@@ -130,6 +132,9 @@ def format_output_ids(obj):
     a scalar id, a list of ids, and ``None`` (left as ``None``). Keys not in the
     map are recursed into but otherwise untouched. ``source_id`` is *not* in the
     map; format it by ``source_kind`` at its emission site.
+
+    Scalar leaves (chunk text, scores, names — most of a search payload) are
+    copied as-is without a recursive call; only containers are descended into.
     """
     if isinstance(obj, dict):
         out = {}
@@ -137,11 +142,16 @@ def format_output_ids(obj):
             id_type = _OUTPUT_FIELD_TYPES.get(key)
             if id_type is not None:
                 out[key] = _format_field(id_type, val)
-            else:
+            elif isinstance(val, _CONTAINERS):
                 out[key] = format_output_ids(val)
+            else:
+                out[key] = val
         return out
     if isinstance(obj, list):
-        return [format_output_ids(item) for item in obj]
+        return [
+            format_output_ids(item) if isinstance(item, _CONTAINERS) else item
+            for item in obj
+        ]
     return obj
 
 
@@ -0,0 +1,26 @@
+"""Structured-output schemas for the tag classifier.
+
+Kept apart from ``_tags`` so that importing the tag helpers doesn't import
+pydantic; only the classification paths load this module.
+"""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+
+class TagsAssignment(BaseModel):
+    tag_ids: list[int] = Field(
+        description=(
+            "The subset of tag_ids from the provided vocabulary that apply "
+            "to this document. Empty list if none apply."
+        ),
+    )
+
+
+class TagApplies(BaseModel):
+    applies: bool = Field(
+        description=(
+            "True if the single tag applies to the document, false otherwise."
+        ),
+    )
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-
-from pydantic import BaseModel, Field
+from typing import TYPE_CHECKING
 
 from bartleby.config import ensure_provider_env, load_config
-from bartleby.providers import Provider, get_provider
 from bartleby.skill_runner import SkillError
 
+if TYPE_CHECKING:
+    from bartleby.providers import Provider
+
 
 # Above this cosine similarity (against an existing tag's description) we
 # treat a proposed tag as a likely duplicate. 0.85 is the issue's published
@@ -18,26 +19,6 @@ from bartleby.skill_runner import SkillError
 SIMILARITY_THRESHOLD = 0.85
 
 
-# ---------- structured-output schemas for the classifier ----------
-
-
-class _TagsAssignment(BaseModel):
-    tag_ids: list[int] = Field(
-        description=(
-            "The subset of tag_ids from the provided vocabulary that apply "
-            "to this document. Empty list if none apply."
-        ),
-    )
-
-
-class _TagApplies(BaseModel):
-    applies: bool = Field(
-        description=(
-            "True if the single tag applies to the document, false otherwise."
-        ),
-    )
-
-
 # ---------- name normalization ----------
 
 
@@ -545,7 +526,8 @@ def find_similar_tag(
       - cosine of BGE embeddings against each existing description, with
         the configured ``SIMILARITY_THRESHOLD``.
 
-    Embeddings are L2-normalized at the embedder, so dot-product is cosine.
+    Embeddings are L2-normalized at the embedder, so dot-product is cosine —
+    scored against the whole vocabulary in one matrix-vector product.
 
     ``embed_texts`` is imported lazily (not at module top) so the FTS-only read
     scripts that share this module via ``resolve_scope`` — ``scan``,
@@ -561,17 +543,20 @@ def find_similar_tag(
         if normalize_name(tag.name) == target_norm:
             return SimilarTag(tag.tag_id, tag.name, tag.description, 1.0)
 
+    import numpy as np
+
     from bartleby.ingest.embed import embed_texts
 
     proposed_emb, *existing_embs = embed_texts(
         [description] + [t.description for t in vocab]
     )
-    best: SimilarTag | None = None
-    for tag, emb in zip(vocab, existing_embs):
-        sim = sum(a * b for a, b in zip(proposed_emb, emb))
-        if sim >= SIMILARITY_THRESHOLD and (best is None or sim > best.similarity):
-            best = SimilarTag(tag.tag_id, tag.name, tag.description, sim)
-    return best
+    sims = np.asarray(existing_embs) @ np.asarray(proposed_emb)
+    i = int(np.argmax(sims))  # first maximum, as the old strict-> scan picked
+    sim = float(sims[i])
+    if sim < SIMILARITY_THRESHOLD:
+        return None
+    tag = vocab[i]
+    return SimilarTag(tag.tag_id, tag.name, tag.description, sim)
 
 
 # ---------- classification ----------
@@ -591,32 +576,58 @@ def resolve_classifier() -> tuple[Provider, str, float]:
             "NO_PROVIDER",
             "No LLM provider configured. Run `bartleby config` first.",
         )
+    # Deferred: the provider stack (and pydantic with it) is only needed to
+    # classify. The FTS-only scripts that share this module for resolve_scope
+    # (scan, search, list_documents, describe_corpus) shouldn't pay for it.
+    from bartleby.providers import get_provider
+
     ensure_provider_env(name, config)
     provider = get_provider(name, ollama_base_url=config.get("ollama_base_url"))
     temperature = float(config.get("temperature", 0))
     return provider, model, temperature
 
 
+@dataclass(frozen=True)
+class VocabularyPrompt:
+    """The sweep-constant half of a full-vocabulary classification."""
+    instructions: str
+    tag_ids: frozenset[int]
+
+
+def build_vocabulary_prompt(vocabulary: list[TagRow]) -> VocabularyPrompt:
+    """Render ``vocabulary`` into classifier instructions, once per sweep.
+
+    The task and vocabulary are identical for every document, so they're built
+    here a single time and go out as ``instructions`` — a cacheable prefix —
+    with only each document's summary riding in the per-call prompt.
+    """
+    lines = [f"  {t.tag_id}: {t.name} — {t.description}" for t in vocabulary]
+    return VocabularyPrompt(
+        instructions=(
+            "Classify the document below against this controlled tag vocabulary. "
+            "Return only the tag_ids that genuinely apply; the empty list is a "
+            "valid answer.\n\n"
+            f"Vocabulary:\n" + "\n".join(lines)
+        ),
+        tag_ids=frozenset(t.tag_id for t in vocabulary),
+    )
+
+
 def classify_full_vocabulary(
     provider: Provider, model: str, temperature: float,
-    *, summary_text: str, vocabulary: list[TagRow],
+    *, summary_text: str, vocabulary: VocabularyPrompt,
 ) -> list[int]:
     """Pick the subset of ``vocabulary`` that applies to ``summary_text``."""
-    if not vocabulary:
+    from bartleby.skill_scripts._tag_schemas import TagsAssignment
+
+    if not vocabulary.tag_ids:
         return []
-    lines = [f"  {t.tag_id}: {t.name} — {t.description}" for t in vocabulary]
-    prompt = (
-        "Classify the document below against this controlled tag vocabulary. "
-        "Return only the tag_ids that genuinely apply; the empty list is a "
-        "valid answer.\n\n"
-        f"Vocabulary:\n" + "\n".join(lines) + "\n\n"
-        f"Document summary:\n{summary_text}"
-    )
     result = provider.classify(
-        prompt, model=model, schema=_TagsAssignment, temperature=temperature,
+        f"Document summary:\n{summary_text}",
+        model=model, schema=TagsAssignment, temperature=temperature,
+        instructions=vocabulary.instructions,
     )
-    valid_ids = {t.tag_id for t in vocabulary}
-    return [tid for tid in result.tag_ids if tid in valid_ids]
+    return [tid for tid in result.tag_ids if tid in vocabulary.tag_ids]
 
 
 def classify_single_tag(
@@ -624,14 +635,17 @@ def classify_single_tag(
     *, summary_text: str, tag: TagRow,
 ) -> bool:
     """Answer whether ``tag`` applies to ``summary_text``."""
-    prompt = (
+    from bartleby.skill_scripts._tag_schemas import TagApplies
+
+    instructions = (
         "Decide whether the single tag below applies to the document.\n\n"
         f"Tag: {tag.name}\n"
-        f"Description: {tag.description}\n\n"
-        f"Document summary:\n{summary_text}"
+        f"Description: {tag.description}"
     )
     result = provider.classify(
-        prompt, model=model, schema=_TagApplies, temperature=temperature,
+        f"Document summary:\n{summary_text}",
+        model=model, schema=TagApplies, temperature=temperature,
+        instructions=instructions,
     )
     return result.applies
 
@@ -74,13 +74,16 @@ def work(*, conn, args, session_id) -> dict:
         f"SELECT COUNT(*) FROM findings f {scope_sql}", scope_params,
     ).fetchone()[0]
 
+    # citation_count is a correlated count over the finding_citations primary
+    # key, so it's computed only for the page of rows returned — not by
+    # aggregating every citation in the corpus on each call.
     rows = cur.execute(
         "SELECT f.finding_id, f.title, f.description, s.name, s.model, s.harness, "
-        "       f.created_at, COALESCE(fc.n, 0) AS citation_count "
+        "       f.created_at, "
+        "       (SELECT COUNT(*) FROM finding_citations fc "
+        "        WHERE fc.finding_id = f.finding_id) AS citation_count "
         "FROM findings f "
         "LEFT JOIN sessions s ON s.session_id = f.session_id "
-        "LEFT JOIN (SELECT finding_id, COUNT(*) AS n FROM finding_citations "
-        "           GROUP BY finding_id) fc ON fc.finding_id = f.finding_id "
         f"{scope_sql} "
         "ORDER BY f.finding_id DESC LIMIT ? OFFSET ?",
         (*scope_params, args.limit, args.offset),
@@ -85,12 +85,18 @@ set.
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import struct
 import subprocess
+import tempfile
+from pathlib import Path
 
+from bartleby.config import bartleby_dir
 from bartleby.db.schema import EMBEDDING_DIM
+from bartleby.lib.consts import EMBEDDING_MODEL
 from bartleby.skill_runner import SkillError, build_arg_parser, run
 from bartleby.skill_scripts._common import (
     add_date_filter_args, add_file_like_arg, add_returning_arg, apply_preview,
@@ -125,6 +131,8 @@ MAX_CONTEXT = 5
 OVERFETCH_MULTIPLIER = 5
 OVERFETCH_FLOOR = 50
 BRIEF_PREVIEW_CHARS = 240
+# Distinct queries kept in the on-disk query-vector cache (3 KB each, so ~3 MB).
+QUERY_VECTOR_CACHE_SIZE = 1024
 
 
 def _context_value(s: str) -> int:
@@ -353,7 +361,86 @@ def _fts_search(
     return [row[0] for row in rows]
 
 
+def _query_vector_dir() -> Path:
+    return bartleby_dir() / "cache" / "query_vectors"
+
+
+def _query_vector_path(query: str) -> Path:
+    """Where the packed vector for ``query`` is cached, keyed by model + text."""
+    digest = hashlib.sha256(f"{EMBEDDING_MODEL}\0{query}".encode("utf-8")).hexdigest()
+    return _query_vector_dir() / f"{digest}.f32"
+
+
 def _embed_query(query: str) -> bytes:
+    """The packed query vector, from the on-disk cache or ``bartleby embed``.
+
+    Each ``bartleby embed`` is a fresh process that loads the model before it
+    encodes a word — seconds per query — and a research session re-runs the
+    same queries. So the packed vector is kept under ``~/.bartleby/cache``
+    (3 KB per distinct query, keyed by model name + query text; safe to
+    delete). It is an LRU by file mtime: a hit touches its file, and each write
+    prunes back to ``QUERY_VECTOR_CACHE_SIZE``. The cache is best-effort: a
+    read or write failure just embeds.
+    """
+    path = _query_vector_path(query)
+    try:
+        cached = path.read_bytes()
+    except OSError:
+        cached = None
+    if cached is not None and len(cached) == 4 * EMBEDDING_DIM:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return cached
+
+    packed = _embed_via_cli(query)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp + atomic rename: a concurrent search reads the old state
+        # or the whole vector, never a torn one.
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(packed)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        _prune_query_vectors(path.parent)
+    except OSError:
+        pass
+    return packed
+
+
+def _prune_query_vectors(cache_dir: Path) -> None:
+    """Drop the least-recently-used vectors beyond ``QUERY_VECTOR_CACHE_SIZE``.
+
+    Runs only after a miss, which has just paid seconds for ``bartleby embed``,
+    so one directory scan is noise. A file a concurrent search already removed
+    is simply skipped.
+    """
+    entries: list[tuple[float, str]] = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".f32"):
+                continue
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                continue
+    excess = len(entries) - QUERY_VECTOR_CACHE_SIZE
+    if excess <= 0:
+        return
+    entries.sort()
+    for _, stale in entries[:excess]:
+        try:
+            os.unlink(stale)
+        except OSError:
+            pass
+
+
+def _embed_via_cli(query: str) -> bytes:
     """Shell out to ``bartleby embed`` via list-form subprocess (SPEC §5.5)."""
     result = subprocess.run(
         ["bartleby", "embed", query],
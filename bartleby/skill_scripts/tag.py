@@ -51,19 +51,23 @@ Output:
 
 A classifier error on a single document never aborts the run: the document is
 recorded in ``failed`` and the loop moves on to the next one. Each
-classification is retried once before being recorded as failed, since provider
-errors (notably an empty Ollama response) are often transient.
+classification is retried up to twice, with exponential backoff, before being
+recorded as failed, since provider errors (notably an empty Ollama response)
+are often transient.
 """
 
 from __future__ import annotations
 
 import argparse
+import random
+import time
 
 from bartleby.skill_runner import SkillError, build_arg_parser, run
 from bartleby.skill_scripts import _tags as tags_helpers
 from bartleby.skill_scripts._ids import format_output_ids, prefixed_int
 from bartleby.skill_scripts._tags import (
     assign,
+    build_vocabulary_prompt,
     classify_full_vocabulary,
     classify_single_tag,
     fetch_vocabulary,
@@ -130,9 +134,20 @@ def _already_tagged(conn, document_id: int, tag_id: int | None) -> bool:
     ).fetchone() is not None
 
 
-# One retry per document: provider errors (e.g. an empty Ollama response) are
-# often transient, and a single bad call shouldn't drop a document from a sweep.
-_CLASSIFY_ATTEMPTS = 2
+# Up to two retries per document: provider errors (e.g. an empty Ollama
+# response) are often transient, and a single bad call shouldn't drop a document
+# from a sweep.
+_CLASSIFY_ATTEMPTS = 3
+
+# Pause before each retry: exponential in the attempt number (1 s, then 2 s),
+# plus a little jitter — so a busy local model gets progressively longer to
+# recover instead of being hit again instantly, and parallel sweeps don't retry
+# in lockstep.
+_RETRY_BASE_SECONDS = 1.0
+
+
+def _backoff(attempt: int) -> None:
+    time.sleep(_RETRY_BASE_SECONDS * 2 ** attempt + random.random() * 0.1)
 
 
 def _classify_document(
@@ -174,6 +189,8 @@ def work(*, conn, args, session_id) -> dict:
             "EMPTY_VOCABULARY",
             "No tags defined yet. Create one with `add_tag` first.",
         )
+    # Rendered once: every document in the sweep shares the same instructions.
+    vocabulary_prompt = build_vocabulary_prompt(vocabulary)
 
     classified: list[dict] = []
     skipped: list[dict] = []
@@ -198,17 +215,20 @@ def work(*, conn, args, session_id) -> dict:
             continue
 
         ident = {"document_id": document_id, "file_name": file_name}
-        for _ in range(_CLASSIFY_ATTEMPTS):
+        for attempt in range(_CLASSIFY_ATTEMPTS):
             try:
                 verdict = _classify_document(
                     conn, provider=provider, model=model, temperature=temperature,
                     document_id=document_id, summary=summary,
-                    single_tag=single_tag, vocabulary=vocabulary, force=args.force,
+                    single_tag=single_tag, vocabulary=vocabulary_prompt,
+                    force=args.force,
                 )
                 classified.append({**ident, **verdict})
                 break
             except Exception as e:  # noqa: BLE001 — one bad doc must not abort the sweep
                 error = f"{type(e).__name__}: {e}"
+                if attempt + 1 < _CLASSIFY_ATTEMPTS:
+                    _backoff(attempt)
         else:
             failed.append({**ident, "error": error})
 
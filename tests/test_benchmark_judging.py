@@ -69,6 +69,28 @@ def test_topup_judges_each_distinct_summary(root):
     assert records[0]["scores"]["mean"] == pytest.approx(4.75)
 
 
+def test_source_is_loaded_once_per_doc_across_models(root, monkeypatch):
+    other = ModelRef("ollama", "other:2b")
+    _add_run(root, _summary(), 0)
+    append_record(root.result_path(other, "doc-a"), {
+        "provider": other.provider, "model": other.model, "doc": "doc-a",
+        "run_index": 0, "ok": True, "summary": _summary("theirs"),
+        "source_sha": source_sha(SOURCE),
+    })
+    loads: list[str] = []
+    real_load = judging.load_source
+
+    def counting_load(root, doc_id, extraction):
+        loads.append(doc_id)
+        return real_load(root, doc_id, extraction)
+
+    monkeypatch.setattr(judging, "load_source", counting_load)
+    client = FakeJudge()
+    judging.run(root, passes=1, judge_client=client)
+    assert client.calls == 2                # both models' summaries judged
+    assert loads == ["doc-a"]               # …against one read of the source
+
+
 def test_second_invocation_is_a_noop(root, capsys):
     _add_run(root, _summary(), 0)
     judging.run(root, passes=3, judge_client=FakeJudge())
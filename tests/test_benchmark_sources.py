@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 from bartleby.benchmark import sources as sources_mod
@@ -124,3 +127,17 @@ def test_source_path_encoding(root):
     assert root.source_path("doc-a", "docling") == root.sources_dir / "doc-a-docling.txt"
     assert (root.source_path("doc-a", "image-fixture")
             == root.sources_dir / "doc-a-image-fixture.txt")
+
+
+def test_sources_import_skips_the_provider_stack():
+    """The token helpers come from bartleby.lib.tokens, so loading sources
+    doesn't drag in the summarizer's providers and pydantic schemas."""
+    code = (
+        "import sys\n"
+        "import bartleby.benchmark.sources\n"
+        "leaked = [m for m in ('bartleby.providers', 'bartleby.ingest.summarize', 'pydantic')\n"
+        "          if any(k == m or k.startswith(m + '.') for k in sys.modules)]\n"
+        "assert not leaked, leaked\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -23,6 +23,12 @@ def test_append_creates_store_and_stamps_timestamp(tmp_path):
     assert records[1]["timestamp"] == 123.0  # explicit timestamp not clobbered
 
 
+def test_append_writes_one_compact_line_per_record(tmp_path):
+    path = tmp_path / "cell.jsonl"
+    append_record(path, {"ok": True, "summary": {"title": "t"}, "timestamp": 1.0})
+    assert path.read_text() == '{"timestamp":1.0,"ok":true,"summary":{"title":"t"}}\n'
+
+
 def test_read_records_skips_malformed_line(tmp_path, capsys):
     path = tmp_path / "cell.jsonl"
     path.write_text(json.dumps({"a": 1}) + "\n{not json\n" + json.dumps({"a": 2}) + "\n")
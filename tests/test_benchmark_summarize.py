@@ -191,3 +191,67 @@ def test_named_extraction_uses_separate_store_and_fixture(root, monkeypatch, tmp
 
     # Default store is untouched
     assert not root.result_path(refs[0], "doc-a").exists()
+
+
+def test_live_token_estimate_encodes_only_the_new_text(monkeypatch):
+    """The active-call estimate re-tokenizes only what streamed in since the last
+    settled word boundary, yet matches a whole-text count at every tick."""
+    import re
+
+    from bartleby.benchmark import progress as progress_mod
+
+    encoded: list[str] = []
+
+    def fake_count(text: str) -> int:
+        # A space-attaching word tokenizer, like cl100k's pre-split.
+        encoded.append(text)
+        return len(re.findall(r" ?[^ ]+| +", text))
+
+    monkeypatch.setattr(progress_mod, "count_tokens", fake_count)
+    prog = progress_mod.BenchmarkProgress(["m"], calls_per_model=1, total_calls=1)
+    prog.start_call("m", "doc", 0, 1)
+
+    words = [f"word{i}" for i in range(200)]
+    content = ""
+    for w in words:
+        delta = (" " if content else "") + w
+        content += delta
+        prog.on_chunk(delta)
+        assert prog._streamed_tokens(prog.active) == len(re.findall(r" ?[^ ]+| +", content))
+
+    # Linear, not quadratic: every character is encoded about twice at most
+    # (once as the unsettled tail, once when it settles).
+    assert sum(len(t) for t in encoded) <= 2 * len(content) + 10 * len(words)
+
+
+def test_benchmark_progress_active_line_survives_the_call_finishing_mid_render():
+    """The render thread captures the active call once; the work thread clearing
+    or replacing ``active`` underneath it must not break or relabel the frame."""
+    from bartleby.benchmark import progress as progress_mod
+
+    prog = progress_mod.BenchmarkProgress(["m"], calls_per_model=2, total_calls=2)
+    prog.start_call("m", "doc-a", 0, 1)
+    prog.on_chunk("hello world")
+    captured = prog.active
+    prog.finish_call("m", True, 12.0)      # work thread: active -> None
+    line = prog._active_line(captured)
+    assert "doc-a" in line.plain and "~2 tok" in line.plain
+
+    prog.start_call("m", "doc-b", 1, 2)    # a new call swaps in
+    assert "doc-a" in prog._active_line(captured).plain
+    assert prog.active.deltas == []
+
+
+def test_benchmark_progress_rebuilds_the_table_only_when_a_call_moves():
+    from bartleby.benchmark import progress as progress_mod
+
+    prog = progress_mod.BenchmarkProgress(["m"], calls_per_model=1, total_calls=1)
+    first = prog._table()
+    assert prog._table() is first           # ticks reuse it
+    prog.start_call("m", "doc", 0, 1)
+    running = prog._table()
+    assert running is not first
+    prog.on_chunk("streamed")               # stream chunks don't touch it
+    assert prog._table() is running
+    prog.finish_call("m", True, 12.0)
+    assert prog._table() is not running
@@ -339,6 +339,34 @@ def test_insert_validates_empty_text(conn):
         ])
 
 
+def test_insert_pairs_each_chunk_id_with_its_own_fts_and_vec_row(conn):
+    """The batched insert pairs RETURNING ids back with their chunks in order,
+    so every FTS5 / sqlite-vec rowid carries that chunk's own text and vector."""
+    import struct
+
+    cur = conn.cursor()
+    doc_id = _insert_doc(conn, "h-batch")
+    chunks = [
+        ChunkInput(text=f"body {i}", embedding=_emb(float(i)), chunk_index=i)
+        for i in range(25)
+    ]
+    ids = insert_document_chunks(conn, doc_id, chunks)
+
+    for chunk_id, c in zip(ids, chunks):
+        assert cur.execute(
+            "SELECT text FROM chunks WHERE chunk_id = ?", (chunk_id,)
+        ).fetchone()[0] == c.text
+        assert cur.execute(
+            "SELECT text FROM chunks_fts WHERE rowid = ?", (chunk_id,)
+        ).fetchone()[0] == c.text
+        blob = cur.execute(
+            "SELECT embedding FROM chunks_vec WHERE rowid = ?", (chunk_id,)
+        ).fetchone()[0]
+        assert struct.unpack(f"{EMBEDDING_DIM}f", blob)[0] == pytest.approx(
+            c.embedding[0]
+        )
+
+
 def test_unique_constraint_on_chunk_index(conn):
     doc_id = _insert_doc(conn, "h7")
     insert_document_chunks(conn, doc_id, [
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import json
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+import numpy as np
 import pytest
 
 from bartleby.commands import embed as embed_cmd
+from bartleby.ingest import embed
 from bartleby.db.schema import EMBEDDING_DIM
 
 
@@ -59,3 +65,73 @@ def test_embed_command_passes_argv_text_through_verbatim(monkeypatch, capsys):
     assert isinstance(vec, list)
     assert len(vec) == EMBEDDING_DIM
     assert all(isinstance(x, float) for x in vec)
+
+
+class _CountingModel:
+    """A stand-in SentenceTransformer that records every batch it encodes."""
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    def encode(self, texts, **_kwargs):
+        self.batches.append(list(texts))
+        return np.array(
+            [[float(len(t))] * EMBEDDING_DIM for t in texts], dtype=np.float32
+        )
+
+
+def test_embed_texts_encodes_each_distinct_text_once(monkeypatch):
+    """Repeated bodies — within one call and across calls — reach the model once;
+    the cached vector comes back in the caller's order."""
+    model = _CountingModel()
+    monkeypatch.setattr(embed, "_model", lambda: model)
+    monkeypatch.setattr(embed, "_CACHE", OrderedDict())
+
+    first = embed.embed_texts(["footer", "body text", "footer"])
+    second = embed.embed_texts(["body text", "new"])
+
+    assert model.batches == [["footer", "body text"], ["new"]]
+    assert first[0] == first[2] == [6.0] * EMBEDDING_DIM
+    assert second[0] == first[1]
+
+
+def test_embed_texts_cache_is_bounded(monkeypatch):
+    model = _CountingModel()
+    monkeypatch.setattr(embed, "_model", lambda: model)
+    monkeypatch.setattr(embed, "_CACHE", OrderedDict())
+    monkeypatch.setattr(embed, "EMBED_CACHE_SIZE", 2)
+
+    embed.embed_texts(["a", "bb", "ccc"])
+    assert len(embed._CACHE) == 2
+    embed.embed_texts(["a"])  # evicted as least-recently-used → re-encoded
+    assert model.batches[-1] == ["a"]
+
+
+def test_embed_texts_cache_rows_do_not_pin_the_batch(monkeypatch):
+    """Each cached vector owns its 3 KB; none is a view holding the batch alive."""
+    model = _CountingModel()
+    monkeypatch.setattr(embed, "_model", lambda: model)
+    monkeypatch.setattr(embed, "_CACHE", OrderedDict())
+
+    embed.embed_texts(["a", "bb", "ccc"])
+
+    assert all(row.base is None for row in embed._CACHE.values())
+
+
+def test_model_loads_once_under_concurrent_callers(monkeypatch):
+    """A persist racing scribe's warm-up thread waits for that load rather
+    than starting a second copy of the model."""
+    loads: list[None] = []
+
+    @lru_cache(maxsize=1)
+    def _slow_load():
+        loads.append(None)
+        time.sleep(0.05)
+        return object()
+
+    monkeypatch.setattr(embed, "_load_model", _slow_load)
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        models = list(ex.map(lambda _: embed._model(), range(4)))
+
+    assert len(loads) == 1
+    assert all(m is models[0] for m in models)
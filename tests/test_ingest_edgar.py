@@ -531,6 +531,34 @@ def test_parse_html_sec2md_builds_container_and_sections(tmp_path, monkeypatch):
     assert parsed.file_hash not in {s.file_hash for s in parsed.sections}
 
 
+def test_parse_html_sec2md_split_embeds_all_sections_in_one_batch(
+    tmp_path, monkeypatch,
+):
+    """Every section's chunks are embedded in a single encode call, and each
+    section still gets back exactly its own vectors."""
+    calls: list[list[str]] = []
+
+    def fake_embed(texts):
+        calls.append(list(texts))
+        return [[float(len(t))] * EMBEDDING_DIM for t in texts]
+
+    monkeypatch.setattr("bartleby.ingest.embed.embed_texts", fake_embed)
+    src = _write(tmp_path, "filing.htm", _ANCHORED_FILING)
+    parsed = parsers._parse_html_sec2md(
+        src, file_hash="container-hash", file_name="filing.htm",
+    )
+
+    assert len(calls) == 1
+    section_chunks = [c for s in parsed.sections for c in s.document_chunks]
+    assert [c.text for c in section_chunks] == calls[0]
+    for c in section_chunks:
+        assert c.embedding == [float(len(c.text))] * EMBEDDING_DIM
+    for s in parsed.sections:
+        assert [c.chunk_index for c in s.document_chunks] == list(
+            range(len(s.document_chunks))
+        )
+
+
 def test_parse_html_sec2md_ingests_unanchored_whole(tmp_path, monkeypatch):
     monkeypatch.setattr(
         "bartleby.ingest.embed.embed_texts",
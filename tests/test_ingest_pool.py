@@ -10,11 +10,17 @@ end-to-end `test_scribe.py` suite covers on the inline path.
 
 from __future__ import annotations
 
+import ctypes
+import ctypes.util
 import os
 from dataclasses import dataclass
 
+import pytest
+
 from bartleby.ingest import pool
 
+_LIBGOMP = ctypes.util.find_library("gomp")
+
 
 @dataclass
 class _Req:
@@ -45,6 +51,23 @@ def _boom_on_three(request: _Req, config: dict, report) -> dict | None:
     return {"n": request.n, "sq": request.n * request.n, "bias": config["bias"]}
 
 
+def _omp_threads(request: _Req, config: dict, report) -> dict:
+    return {"n": request.n, "omp": os.environ.get("OMP_NUM_THREADS")}
+
+
+def _omp_runtime(request: _Req, config: dict, report) -> dict:
+    # What an OpenMP runtime loaded fresh in the worker resolves from the
+    # worker's environment: the system libgomp, not the copy torch wheels
+    # bundle, so this checks the settings every OpenMP runtime there reads
+    # rather than torch's own pool.
+    gomp = ctypes.CDLL(_LIBGOMP)
+    return {
+        "n": request.n,
+        "limit": gomp.omp_get_thread_limit(),
+        "max_threads": gomp.omp_get_max_threads(),
+    }
+
+
 def test_parse_stream_inline_runs_in_process():
     out = list(pool.parse_stream(
         [_Req(1), _Req(2), _Req(3)],
@@ -72,6 +95,37 @@ def test_parse_stream_pool_spawns_and_returns_all():
     assert all(o["bias"] == 10 for o in out)
 
 
+def test_parse_stream_pool_splits_the_cores_across_workers(monkeypatch):
+    """Each pooled worker's torch thread pool gets its share of the cores rather
+    than all of them; an explicit OMP_NUM_THREADS is left alone."""
+    monkeypatch.delenv("OMP_NUM_THREADS", raising=False)
+    monkeypatch.setattr(pool.os, "cpu_count", lambda: 8)
+    out = list(pool.parse_stream(
+        [_Req(1), _Req(2)], parse_fn=_omp_threads, config={}, max_workers=2,
+    ))
+    assert [o["omp"] for o in out] == ["4", "4"]
+
+    monkeypatch.setenv("OMP_NUM_THREADS", "3")
+    out = list(pool.parse_stream(
+        [_Req(1)], parse_fn=_omp_threads, config={}, max_workers=2,
+    ))
+    assert out[0]["omp"] == "3"
+
+
+@pytest.mark.skipif(_LIBGOMP is None, reason="libgomp not available")
+def test_parse_stream_pool_worker_openmp_runs_its_share(monkeypatch):
+    """The worker's environment, as an OpenMP runtime reads it, gives teams
+    the worker's share of the cores and caps none of them at one thread."""
+    monkeypatch.delenv("OMP_NUM_THREADS", raising=False)
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    monkeypatch.setattr(pool.os, "cpu_count", lambda: 8)
+    out = list(pool.parse_stream(
+        [_Req(1), _Req(2)], parse_fn=_omp_runtime, config={}, max_workers=2,
+    ))
+    assert all(o["limit"] != 1 for o in out)
+    assert [o["max_threads"] for o in out] == [4, 4]
+
+
 def test_parse_stream_pool_recycles_workers(monkeypatch):
     # maxtasksperchild recycles a worker after WORKER_MAX_TASKS docs so a long run
     # can't grow RSS unbounded (#213). With a cap of 2 over 8 tasks, more than
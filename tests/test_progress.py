@@ -80,6 +80,17 @@ def test_header_shows_dash_until_known_then_the_tally():
     assert "caption —" in header and "summarize —" in header
 
 
+def test_header_is_rebuilt_only_when_a_tally_moves():
+    sp = ScribeProgress(n_lanes=2)
+    par = sp.phase("parse")
+    par.start(4)
+    first = sp._header()
+    assert sp._header() is first            # refreshes reuse it
+    par.advance()
+    assert sp._header() is not first
+    assert "parse 1/4" in sp._header().plain
+
+
 def test_zero_work_phase_reads_as_finished_not_unknown():
     # A phase with no work (#503): an all-text ingest has no images to caption and
     # may owe no summaries, so its loop early-returns with start(0). That must read
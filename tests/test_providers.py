@@ -209,6 +209,34 @@ def test_anthropic_classify_keeps_temperature_on_older_model(monkeypatch):
     assert fake.last_call["temperature"] == 0.3
 
 
+def test_anthropic_classify_caches_the_instructions_prefix(monkeypatch):
+    # Sweep-constant instructions go out as a system block with a cache
+    # breakpoint; the per-call prompt stays the only user content.
+    class _Schema(BaseModel):
+        ok: bool
+
+    response = _FakeAnthropicResponse([
+        _block("tool_use", name="save_classification", input_={"ok": True}),
+    ])
+    fake = _install_anthropic(monkeypatch, response)
+    from bartleby.providers.anthropic import AnthropicProvider
+    AnthropicProvider().classify(
+        "Document summary:\nx", model="claude-haiku-4-5", schema=_Schema,
+        instructions="Vocabulary: ...",
+    )
+    assert fake.last_call["system"] == [{
+        "type": "text",
+        "text": "Vocabulary: ...",
+        "cache_control": {"type": "ephemeral"},
+    }]
+    assert fake.last_call["messages"] == [
+        {"role": "user", "content": "Document summary:\nx"},
+    ]
+    # Without instructions no system prompt is sent at all.
+    bare, _ = _classify_on(monkeypatch, "claude-haiku-4-5")
+    assert "system" not in bare.last_call
+
+
 def test_anthropic_analyze_image_validates_tool_input(monkeypatch):
     response = _FakeAnthropicResponse([
         _block("tool_use", name="save_image_description", input_=_VLM_INPUT),
@@ -349,6 +377,22 @@ def test_openai_classify_omits_temperature(monkeypatch):
     assert "temperature" not in fake.last_call
 
 
+def test_openai_classify_leads_with_the_instructions_as_system(monkeypatch):
+    class _Schema(BaseModel):
+        ok: bool
+
+    fake = _install_openai(monkeypatch, _FakeOpenAIResponse(parsed=_Schema(ok=True)))
+    from bartleby.providers.openai import OpenAIProvider
+    OpenAIProvider().classify(
+        "Document summary:\nx", model="gpt-5-nano", schema=_Schema,
+        instructions="Vocabulary: ...",
+    )
+    assert fake.last_call["messages"] == [
+        {"role": "system", "content": "Vocabulary: ..."},
+        {"role": "user", "content": "Document summary:\nx"},
+    ]
+
+
 def test_openai_warns_once_on_dropped_temperature(monkeypatch):
     from bartleby.providers import openai as mod
     monkeypatch.setattr(mod, "_temperature_warned", False)
@@ -438,6 +482,13 @@ def test_ollama_summarize_validates_json(monkeypatch):
     assert fake.last_call["format"] == DocumentSummary.model_json_schema()
 
 
+def test_json_schema_is_built_once_per_class():
+    from bartleby.providers.base import json_schema
+    first = json_schema(DocumentSummary)
+    assert first == DocumentSummary.model_json_schema()
+    assert json_schema(DocumentSummary) is first
+
+
 def test_ollama_analyze_image_passes_bytes(monkeypatch):
     fake = _install_ollama(monkeypatch,
                            _FakeOllamaResponse(content=json.dumps(_VLM_INPUT)))
@@ -480,10 +531,11 @@ def _install_wsjpt(monkeypatch, parse_return):
     calls: dict = {}
 
     class _FakeJpt:
-        def __init__(self, schema, *, model_config, custom_instructions=None):
+        def __init__(self, schema, *, model_config, **kwargs):
             calls["schema"] = schema
             calls["model_config"] = model_config
-            calls["custom_instructions"] = custom_instructions
+            calls["custom_instructions"] = kwargs.get("custom_instructions")
+            calls["jpt_kwargs"] = kwargs
 
         def parse(self, *, input_text=None, binary_files=None):
             calls["input_text"] = input_text
@@ -520,10 +572,26 @@ def test_wsjpt_classify_routes_schema_and_prompt(monkeypatch):
     # self-contained, so no custom_instructions are attached.
     assert calls["schema"] is _TagsAssignment
     assert calls["input_text"] == "the self-contained prompt"
-    assert calls["custom_instructions"] is None
+    assert "custom_instructions" not in calls["jpt_kwargs"]
     assert calls["model_config"].model == "fast"
 
 
+def test_wsjpt_classify_passes_instructions_as_custom_instructions(monkeypatch):
+    class _TagsAssignment(BaseModel):
+        tag_ids: list[int]
+
+    calls = _install_wsjpt(monkeypatch, _TagsAssignment(tag_ids=[]))
+
+    from bartleby.providers.wsjpt import WsjptProvider
+    WsjptProvider().classify(
+        "SUMMARY:\n...", model="fast", schema=_TagsAssignment,
+        instructions="Pick from this vocabulary.",
+    )
+
+    assert calls["jpt_kwargs"] == {"custom_instructions": "Pick from this vocabulary."}
+    assert calls["input_text"] == "SUMMARY:\n..."
+
+
 # ---------- wsjpt: pydantic-ai version guard (#683) ----------
 #
 # wsjpt's Vertex AI/ADC auth path calls GoogleProvider(vertexai=...), which
@@ -390,6 +390,71 @@ def test_scribe_writes_summary_when_provider_configured(
         conn.close()
 
 
+def test_scribe_warms_the_embedder_while_a_pooled_parse_runs(
+    isolated_project, tmp_path, mock_embed, monkeypatch
+):
+    # A pooled parse embeds in its workers, so the main process loads its own
+    # embedder for summarize on a side thread during parse, not after it.
+    import threading
+
+    _summary_pipeline(monkeypatch)
+    monkeypatch.setattr(
+        "bartleby.ingest.resolve._resolve_max_workers", lambda *a, **k: 2,
+    )
+    warmed = threading.Event()
+    monkeypatch.setattr("bartleby.ingest.embed.prewarm", warmed.set)
+    seen: list[bool] = []
+
+    def fake_parse_all(*a, **k):
+        seen.append(warmed.wait(timeout=5))
+        return []
+
+    monkeypatch.setattr(parse, "parse_all", fake_parse_all)
+    scribe.main(project="test_proj", files=str(_write_txt(tmp_path / "a.txt", "x")))
+    assert seen == [True]
+
+
+def test_scribe_skips_the_embedder_warmup_with_nothing_to_embed_after_parse(
+    isolated_project, tmp_path, mock_embed, monkeypatch
+):
+    monkeypatch.setattr(
+        "bartleby.ingest.resolve._resolve_max_workers", lambda *a, **k: 2,
+    )
+    calls: list[None] = []
+    monkeypatch.setattr("bartleby.ingest.embed.prewarm", lambda: calls.append(None))
+    monkeypatch.setattr(parse, "parse_all", lambda *a, **k: [])
+    scribe.main(project="test_proj", files=str(_write_txt(tmp_path / "a.txt", "x")))
+    assert calls == []
+
+
+def test_scribe_skips_the_embedder_warmup_for_vision_without_summaries(
+    isolated_project, tmp_path, mock_embed, monkeypatch
+):
+    # Vision on but summaries off: the run may have no images at all, so parse
+    # must not end by waiting on a model load nothing might use.
+    monkeypatch.setattr(
+        "bartleby.commands.scribe.load_config",
+        lambda: {
+            "summary_depth": "none",
+            "vision_provider": "stub",
+            "vision_model": "stub-vl:1",
+            "vision_max_dimension": 1024,
+        },
+    )
+    monkeypatch.setattr(
+        "bartleby.ingest.resolve.get_provider",
+        lambda name, **kwargs: _StubVisionProvider(),
+    )
+    monkeypatch.setattr(
+        "bartleby.ingest.resolve._resolve_max_workers", lambda *a, **k: 2,
+    )
+    calls: list[None] = []
+    monkeypatch.setattr("bartleby.ingest.embed.prewarm", lambda: calls.append(None))
+    monkeypatch.setattr(parse, "parse_all", lambda *a, **k: [])
+    scribe.main(project="test_proj", files=str(_write_txt(tmp_path / "a.txt", "x")))
+    assert calls == []
+
+
 def test_scribe_summarizes_existing_document_on_later_run(
     isolated_project, tmp_path, mock_embed, monkeypatch
 ):
@@ -1568,6 +1633,17 @@ def test_is_complete_false_when_image_uncaptioned(isolated_project):
         conn.close()
 
 
+def test_hash_file_is_plain_sha256_of_the_bytes(tmp_path):
+    """``file_hash`` is the sha256 of the file's bytes — the identity the section
+    hash (``sha256(file_bytes + anchor_id)``) and dedup both build on."""
+    import hashlib
+
+    p = tmp_path / "big.bin"
+    data = bytes(range(256)) * 1024  # spans many read blocks
+    p.write_bytes(data)
+    assert classify._hash_file(p) == hashlib.sha256(data).hexdigest()
+
+
 def test_classify_dedupes_byte_identical_incomplete_resume(isolated_project, tmp_path):
     """Two byte-identical copies of an incomplete, already-parsed file resume the
     one document once: the first lands in to_resume, the twin is diverted to
@@ -2889,3 +2965,58 @@ def test_persist_parse_rolls_back_on_mid_unit_failure(isolated_project, tmp_path
         assert cur.execute("SELECT COUNT(*) FROM images").fetchone()[0] == 0
     finally:
         conn.close()
+
+
+def test_caption_pool_keeps_a_bounded_number_of_images_in_flight(monkeypatch):
+    """The pooled caption path tops up one analysis per completion instead of
+    submitting every image up front — never more than ``2 * caption_workers``
+    analyses are started but not yet persisted."""
+    import threading
+
+    from bartleby.ingest import caption
+    from bartleby.ingest.parse import DocUnit
+    from bartleby.ingest.writer import PendingImage
+
+    lock = threading.Lock()
+    started = persisted = peak = 0
+
+    def _analyze_image(pending, **kwargs):
+        nonlocal started, peak
+        with lock:
+            started += 1
+            peak = max(peak, started - persisted)
+        return pending.image_id
+
+    class _Writer:
+        def uncaptioned_images(self, document_id):
+            return [
+                PendingImage(
+                    image_id=i, file_hash=f"h{i}", file_path="unused",
+                    width=1, height=1, page_number=None,
+                )
+                for i in range(20)
+            ]
+
+        def is_capped(self, file_hash, stage):
+            return False
+
+        def persist_caption(self, image_id):
+            nonlocal persisted
+            with lock:
+                persisted += 1
+
+        def record_failure(self, *a):  # pragma: no cover - nothing fails here
+            raise AssertionError("no analysis should fail")
+
+    monkeypatch.setattr(caption, "_analyze_image", _analyze_image)
+    monkeypatch.setattr(
+        caption, "_caption_from_analysis", lambda pi, analysis, model: analysis,
+    )
+    unit = DocUnit(document_id=1, file_name="doc.pdf", file_hash="d")
+    caption._caption_all(
+        _Writer(), [unit], vision_provider=object(), vision_model="m",
+        vision_temperature=0.0, vision_enabled=True, caption_workers=2,
+        timings=False,
+    )
+    assert persisted == 20
+    assert peak <= 4
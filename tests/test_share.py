@@ -51,8 +51,9 @@ class FakeS3Client:
     def __init__(self):
         self.objects: dict[tuple[str, str], bytes] = {}
 
-    def put_object(self, *, Bucket: str, Key: str, Body: bytes) -> dict:
-        self.objects[(Bucket, Key)] = Body
+    def put_object(self, *, Bucket: str, Key: str, Body) -> dict:
+        # Like boto3, accept bytes or a readable file object.
+        self.objects[(Bucket, Key)] = Body if isinstance(Body, bytes) else Body.read()
         return {}
 
     def get_object(self, *, Bucket: str, Key: str) -> dict:
@@ -266,6 +267,25 @@ def test_parse_s3_url():
         parse_s3_url("s3:///no-bucket")
 
 
+def test_put_file_streams_an_open_file_as_the_body(tmp_path):
+    # boto3 streams a file-object body; put_file must hand one over rather than
+    # reading the whole artifact into memory first.
+    from bartleby.share import s3
+
+    src = tmp_path / "big.db"
+    src.write_bytes(b"x" * 4096)
+    seen = {}
+
+    class _Client:
+        def put_object(self, *, Bucket, Key, Body):
+            seen["is_bytes"] = isinstance(Body, bytes)
+            seen["data"] = Body.read()
+
+    url = s3.put_file(_Client(), parse_s3_url("s3://b/p"), "big.db", src)
+    assert url == "s3://b/p/big.db"
+    assert seen == {"is_bytes": False, "data": b"x" * 4096}
+
+
 # --------------------------------------------------------------------------- #
 # import (issue #520) — round-trips against the same stubbed S3 client.
 # --------------------------------------------------------------------------- #
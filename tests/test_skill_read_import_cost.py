@@ -6,8 +6,10 @@ the chunker + ``embed_texts`` at module top — dragging ``docling`` / ``filetyp
 (and the lazy ``sentence_transformers`` model loader) into every invocation. The
 heavy imports are now function-local to the helpers that actually embed
 (``embed_body_chunks`` / ``find_similar_tag``), so a read-script *import* never
-pays for them. Each assertion runs in a fresh interpreter so a module another
-test already imported can't mask a regression.
+pays for them. The same goes for the classifier's provider stack and its
+pydantic schemas, which only ``tag`` needs. Each assertion runs in a fresh
+interpreter so a module another test already imported can't mask a
+regression.
 """
 
 from __future__ import annotations
@@ -23,7 +25,8 @@ READ_SCRIPTS = ("scan", "list_documents", "read_chunks", "describe_corpus")
 # is intentionally excluded: it rides in via sqlite-vec on the DB connection,
 # which is core read-path infrastructure, not the embedding stack.)
 FORBIDDEN = ("bartleby.ingest.embed", "sentence_transformers", "torch",
-             "docling", "filetype", "bartleby.ingest.chunk")
+             "docling", "filetype", "bartleby.ingest.chunk",
+             "bartleby.providers", "pydantic")
 
 
 @pytest.mark.parametrize("script", READ_SCRIPTS)
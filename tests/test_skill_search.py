@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import struct
 
 import pytest
@@ -15,6 +16,9 @@ from tests._skill_fixtures import (  # noqa: F401
     dated_corpus, project_env, seeded_project,
 )
 
+# The real query embedder, kept before the autouse stub below replaces it.
+_real_embed_query = search_script._embed_query
+
 
 @pytest.fixture(autouse=True)
 def stub_embed(monkeypatch):
@@ -1041,3 +1045,54 @@ def test_search_date_filter_matches_scan_on_same_bounds(dated_corpus, capsys):
         search_out["filters"]["excluded_null_dated"]
         == scan_out["filters"]["excluded_null_dated"]
     )
+
+
+def test_embed_query_caches_the_vector_across_invocations(monkeypatch):
+    from types import SimpleNamespace
+
+    calls: list[list[str]] = []
+
+    def fake_run(argv, **kwargs):
+        calls.append(argv)
+        return SimpleNamespace(
+            returncode=0, stdout=json.dumps([0.5] * EMBEDDING_DIM), stderr="",
+        )
+
+    monkeypatch.setattr(search_script.subprocess, "run", fake_run)
+    first = _real_embed_query("board compensation")
+    again = _real_embed_query("board compensation")
+    assert again == first == struct.pack(f"{EMBEDDING_DIM}f", *[0.5] * EMBEDDING_DIM)
+    assert len(calls) == 1                   # the second search skipped the model
+
+    _real_embed_query("something else")
+    assert len(calls) == 2                   # keyed by the query text
+
+
+def test_embed_query_cache_evicts_the_least_recently_used(monkeypatch):
+    from types import SimpleNamespace
+
+    calls: list[str] = []
+
+    def fake_run(argv, **kwargs):
+        calls.append(argv[-1])
+        return SimpleNamespace(
+            returncode=0, stdout=json.dumps([0.5] * EMBEDDING_DIM), stderr="",
+        )
+
+    monkeypatch.setattr(search_script.subprocess, "run", fake_run)
+    monkeypatch.setattr(search_script, "QUERY_VECTOR_CACHE_SIZE", 2)
+
+    def age(query, mtime):
+        os.utime(search_script._query_vector_path(query), (mtime, mtime))
+
+    _real_embed_query("a")
+    age("a", 1_000)
+    _real_embed_query("b")
+    age("b", 2_000)
+    _real_embed_query("a")                   # a hit refreshes "a"...
+    _real_embed_query("c")                   # ...so "b" is the one evicted
+
+    cached = list(search_script._query_vector_dir().glob("*.f32"))
+    assert len(cached) == 2
+    assert not search_script._query_vector_path("b").exists()
+    assert calls == ["a", "b", "c"]
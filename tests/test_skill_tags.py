@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import time
 
 import pytest
 from pydantic import BaseModel
@@ -54,6 +55,15 @@ def stub_embed(monkeypatch):
     monkeypatch.setattr("bartleby.ingest.embed.embed_texts", _stub)
 
 
+@pytest.fixture
+def retry_sleeps(monkeypatch):
+    """Record (rather than wait out) the classifier's retry backoff. Requested
+    only by the tests that make the classifier fail."""
+    sleeps: list[float] = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    return sleeps
+
+
 @pytest.fixture
 def stub_classifier(monkeypatch):
     """Replace the real provider with a recorded classification stub.
@@ -68,7 +78,8 @@ def stub_classifier(monkeypatch):
     class _StubProvider:
         name = "stub"
 
-        def classify(self, prompt, *, model, schema, temperature=0.0):
+        def classify(self, prompt, *, model, schema, temperature=0.0,
+                     instructions=None):
             v = verdicts.pop(0)
             return schema.model_validate(v)
 
@@ -173,6 +184,26 @@ def test_add_tag_detects_similar_description(seeded_project, capsys):
     assert out["similar_to"]["similarity"] >= tags_helpers.SIMILARITY_THRESHOLD
 
 
+def test_find_similar_tag_returns_the_closest_description(seeded_project):
+    conn = open_db(seeded_project["project"])
+    try:
+        cur = conn.cursor()
+        cur.execute("INSERT INTO tags (name, description) VALUES "
+                    "('weather', 'storm damage reports'), "
+                    "('rates', 'Central Hudson rate-case filings'), "
+                    "('rates2', 'Central Hudson filings')")
+        hit = tags_helpers.find_similar_tag(
+            conn, name="ch", description="Central Hudson rate-case filings",
+        )
+        assert hit is not None and hit.name == "rates"
+        assert isinstance(hit.similarity, float)
+        assert tags_helpers.find_similar_tag(
+            conn, name="x", description="unrelated words entirely",
+        ) is None
+    finally:
+        conn.close()
+
+
 def test_add_tag_rejects_whitespace_name(seeded_project, capsys):
     # A whitespace-only name has no alphanumeric content; it falls through to
     # the normalize_name guard and reports EMPTY_NORMALIZED_NAME.
@@ -687,6 +718,32 @@ def test_tag_full_vocab_assigns(seeded_project, capsys, stub_classifier):
     assert any(s["reason"] == "no_summary" for s in out["skipped"])
 
 
+def test_classify_full_vocabulary_sends_the_prebuilt_instructions():
+    # The vocabulary is rendered once per sweep; each call reuses the same
+    # instructions and only the summary varies. Unknown ids are dropped.
+    vocabulary = tags_helpers.build_vocabulary_prompt([
+        tags_helpers.TagRow(tag_id=1, name="a", description="d1"),
+        tags_helpers.TagRow(tag_id=2, name="b", description="d2"),
+    ])
+    seen: list[tuple[str, str]] = []
+
+    class _Provider:
+        def classify(self, prompt, *, model, schema, temperature=0.0,
+                     instructions=None):
+            seen.append((prompt, instructions))
+            return schema.model_validate({"tag_ids": [2, 99]})
+
+    for summary in ("first", "second"):
+        assert tags_helpers.classify_full_vocabulary(
+            _Provider(), "m", 0.0, summary_text=summary, vocabulary=vocabulary,
+        ) == [2]
+    assert [p for p, _ in seen] == [
+        "Document summary:\nfirst", "Document summary:\nsecond",
+    ]
+    assert seen[0][1] is seen[1][1] is vocabulary.instructions
+    assert "  1: a — d1\n  2: b — d2" in vocabulary.instructions
+
+
 def test_tag_full_vocab_skips_already_tagged(
     seeded_project, capsys, stub_classifier
 ):
@@ -748,7 +805,9 @@ def test_tag_single_tag_force_can_unassign(
         conn.close()
 
 
-def test_tag_one_failure_does_not_abort_run(seeded_project, capsys, monkeypatch):
+def test_tag_one_failure_does_not_abort_run(
+    seeded_project, capsys, monkeypatch, retry_sleeps,
+):
     """A classifier error on one document records it in `failed` and the rest
     of the sweep still runs (issue #36)."""
     conn = open_db(seeded_project["project"])
@@ -769,7 +828,8 @@ def test_tag_one_failure_does_not_abort_run(seeded_project, capsys, monkeypatch)
         """Raises on the alpha document, succeeds on every other."""
         name = "stub"
 
-        def classify(self, prompt, *, model, schema, temperature=0.0):
+        def classify(self, prompt, *, model, schema, temperature=0.0,
+                     instructions=None):
             if "alpha" in prompt:
                 raise RuntimeError(
                     "Ollama returned an empty response for _TagApplies."
@@ -799,7 +859,9 @@ def test_tag_one_failure_does_not_abort_run(seeded_project, capsys, monkeypatch)
     assert "RuntimeError" in out["failed"][0]["error"]
 
 
-def test_tag_retries_transient_failure_once(seeded_project, capsys, monkeypatch):
+def test_tag_retries_transient_failure_once(
+    seeded_project, capsys, monkeypatch, retry_sleeps,
+):
     """An empty/transient classifier error is retried once before being
     recorded as failed (issue #36)."""
     conn = open_db(seeded_project["project"])
@@ -816,7 +878,8 @@ def test_tag_retries_transient_failure_once(seeded_project, capsys, monkeypatch)
         """Fails the first call, succeeds on the retry."""
         name = "stub"
 
-        def classify(self, prompt, *, model, schema, temperature=0.0):
+        def classify(self, prompt, *, model, schema, temperature=0.0,
+                     instructions=None):
             calls["n"] += 1
             if calls["n"] == 1:
                 raise RuntimeError(
@@ -842,10 +905,65 @@ def test_tag_retries_transient_failure_once(seeded_project, capsys, monkeypatch)
     out = json.loads(capsys.readouterr().out)
 
     assert calls["n"] == 2          # one failure, then a successful retry
+    # ...with one backed-off pause between them, not an instant re-call.
+    assert len(retry_sleeps) == 1
+    assert tag_script._RETRY_BASE_SECONDS <= retry_sleeps[0] < (
+        tag_script._RETRY_BASE_SECONDS + 0.1
+    )
     assert out["failed"] == []
     assert out["classified"][0]["applies"] is True
 
 
+def test_tag_backs_off_exponentially_before_recording_failure(
+    seeded_project, capsys, monkeypatch, retry_sleeps,
+):
+    """A document that keeps failing gets every attempt, each pause twice the
+    last, and only then lands in ``failed``."""
+    conn = open_db(seeded_project["project"])
+    try:
+        conn.cursor().execute(
+            "INSERT INTO tags (name, description) VALUES ('a', 'd1')"
+        )
+    finally:
+        conn.close()
+
+    calls = {"n": 0}
+
+    class _DownProvider:
+        name = "stub"
+
+        def classify(self, prompt, *, model, schema, temperature=0.0,
+                     instructions=None):
+            calls["n"] += 1
+            raise RuntimeError("connection refused")
+
+        def summarize(self, *a, **k):
+            raise NotImplementedError
+
+        def analyze_image(self, *a, **k):
+            raise NotImplementedError
+
+    monkeypatch.setattr(
+        tags_helpers, "resolve_classifier",
+        lambda: (_DownProvider(), "stub-model", 0.0),
+    )
+
+    tag_script.main([
+        "--project", seeded_project["project"],
+        "--document-id", f"document:{seeded_project['doc_a']}", "--tag", "a",
+    ])
+    out = json.loads(capsys.readouterr().out)
+
+    assert calls["n"] == tag_script._CLASSIFY_ATTEMPTS == 3
+    base = tag_script._RETRY_BASE_SECONDS
+    assert len(retry_sleeps) == 2   # no pause after the last attempt
+    assert base <= retry_sleeps[0] < base + 0.1
+    assert 2 * base <= retry_sleeps[1] < 2 * base + 0.1
+    assert [f["document_id"] for f in out["failed"]] == [
+        f"document:{seeded_project['doc_a']}"
+    ]
+
+
 def test_resolve_classifier_no_provider_names_config_command(monkeypatch):
     """The NO_PROVIDER error points at `bartleby config`, not the stale
     `bartleby ready` (issue #329)."""
@@ -6,9 +6,8 @@ from dataclasses import dataclass
 
 import pytest
 
-from bartleby.ingest.summarize import (
-    count_tokens, normalize_authored_date, summarize,
-)
+from bartleby.ingest.summarize import normalize_authored_date, summarize
+from bartleby.lib.tokens import count_tokens
 from bartleby.providers.base import DocumentSummary
 
 
@@ -94,6 +93,19 @@ def test_summarize_long_doc_truncates_input_and_appends_note():
     assert count_tokens(p.captured_text) <= 10
 
 
+def test_token_counting_treats_special_token_text_as_plain_text():
+    # A literal "<|endoftext|>" in a document is ordinary text, not a reason to
+    # raise — count and truncation must both get through it.
+    text = "before <|endoftext|> after " * 50
+    assert count_tokens(text) > 0
+
+    p = FakeProvider()
+    summarize(
+        text, provider=p, model="m", temperature=0.0, max_summarize_tokens=10,
+    )
+    assert count_tokens(p.captured_text) <= 10
+
+
 def test_summarize_rejects_empty_document():
     with pytest.raises(ValueError):
         summarize(